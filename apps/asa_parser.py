@@ -19,6 +19,11 @@ for parsing show command outputs.
 
 import pandas as pd
 import logging
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 from ciscoconfparse2 import CiscoConfParse
 from ntc_templates.parse import parse_output
 import openpyxl
@@ -27,8 +32,61 @@ from openpyxl.worksheet.table import Table, TableStyleInfo
 import datetime
 import os
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Bucket keyword of a top-level line: the first two tokens for keywords that
+# are only meaningful with their qualifier (e.g. "crypto map", "clock timezone"),
+# otherwise the first token
+_SECTION_KEYWORD_RE = re.compile(r"(?:ASA|boot|clock|dns|crypto) \S+|\S+")
+
+# Positional fields of route, NAT and crypto map lines. Later fields are
+# optional so short lines still match and leave them as None.
+_ROUTE_RE = re.compile(
+    r"route\s+(?P<interface>\S+)\s+(?P<network>\S+)\s+(?P<mask>\S+)"
+    r"\s+(?P<next_hop>\S+)(?:\s+(?P<distance>\S+))?"
+)
+_NAT_RE = re.compile(
+    r"\S+(?:\s+\S+(?:\s+(?P<source>\S+)"
+    r"(?:\s+\S+(?:\s+(?P<destination>\S+)"
+    r"(?:\s+\S+(?:\s+(?P<translation>\S+)"
+    r"(?:\s+(?P<options>.*\S))?)?)?)?)?)?)?"
+)
+_CRYPTO_MAP_RE = re.compile(r"\S+\s+\S+(?:\s+(?P<name>\S+)(?:\s+(?P<seq>\S+))?)?")
+
+# Number of set bits for every possible octet value
+_POPCOUNT = bytes(bin(i).count('1') for i in range(256))
+
+
+@lru_cache(maxsize=64)
+def _mask_to_prefixlen(subnet_mask):
+    """Count the set bits of a dotted-decimal mask (configs reuse a handful of masks)."""
+    return sum(_POPCOUNT[int(x)] for x in subnet_mask.split('.'))
+
+
+# Keyword sets consulted while walking ACL tokens
+_ACL_FLAG_KEYWORDS = frozenset({'disable', 'inactive'})
+_ACL_PROTOCOLS = frozenset({'ip', 'tcp', 'udp', 'icmp'})
+_ACL_PROTOCOL_OBJECT_TYPES = frozenset({'protocol', 'TCPUDP'})
+_ACL_NETWORK_OBJECT_TYPES = frozenset({'network', 'network-object'})
+_ACL_SERVICE_OBJECT_TYPES = frozenset({'service', 'service-object', 'tcp', 'udp'})
+
+# Shared copies of the keywords repeated on every ACL line, so large ACLs
+# hold one string object per value instead of one per entry
+_ACL_INTERN = {
+    keyword: sys.intern(keyword)
+    for keyword in ('extended', 'standard', 'webtype', 'ethertype',
+                    'permit', 'deny', 'ip', 'tcp', 'udp', 'icmp', 'any')
+}
+
+# Object/object-group member keyword -> index of the token holding its value.
+# Member keywords are always the first token of the child line. Ranges
+# ('range <start> <end>', 'port-object range <start> <end>') are handled
+# separately in extract_object_details since their value spans two tokens.
+_OBJECT_VALUE_INDEX = {
+    'network-object': -1,
+    'subnet': -2,
+    'host': -1,
+    'port-object': -1,
+    'group-object': 1,
+}
 
 
 class AsaParser:
@@ -152,7 +210,7 @@ class AsaParser:
                 sections = self.split_config_into_sections(config_data)
                 parsed_data = {}
                 for section_name, section_data in sections.items():
-                    logging.debug(f"Parsing section: {section_name}")
+                    logging.debug("Parsing section: %s", section_name)
                     parsed_data[section_name] = self.parse_section(section_name, section_data)
                 return parsed_data
         except Exception as e:
@@ -174,11 +232,17 @@ class AsaParser:
                  False otherwise
         
         Note:
-            Currently checks for "ASA Version" and "interface" keywords
-            as indicators of a running configuration.
+            Currently checks for the "ASA Version" banner followed by an
+            "interface" keyword as indicators of a running configuration.
         """
-        # Simple heuristic: check for common running-config markers
-        return "ASA Version" in config_data and "interface" in config_data
+        # Simple heuristic: interfaces are configured after the version banner,
+        # so search for them from there instead of rescanning from the start.
+        # Both finds stop at the first hit, so a running config (banner on its
+        # first lines) is classified after touching only its header. The search
+        # is deliberately not bounded to a head window: show-tech files embed
+        # the running config deep in the file and must still be detected.
+        version_pos = config_data.find("ASA Version")
+        return version_pos >= 0 and config_data.find("interface", version_pos) >= 0
 
     def split_config_into_sections(self, config_data):
         """
@@ -208,7 +272,7 @@ class AsaParser:
             'access_lists': self.extract_section(config_data, 'access-list'),
             # Add more sections as needed
         }
-        logging.debug(f"Sections identified: {list(sections.keys())}")
+        logging.debug("Sections identified: %s", list(sections))
         return sections
 
     def extract_section(self, config_data, section_keyword):
@@ -233,16 +297,21 @@ class AsaParser:
             >>> print(section)
             'interface GigabitEthernet0/1\\n ip address 192.168.1.1'
         """
-        section_lines = []
-        capture = False
-        for line in config_data.splitlines():
-            if line.startswith(section_keyword):
-                capture = True
-            if capture:
-                section_lines.append(line)
-            if line == '' and capture:
-                break
-        return '\n'.join(section_lines)
+        # Locate the first line starting with the keyword
+        if config_data.startswith(section_keyword):
+            start = 0
+        else:
+            start = config_data.find('\n' + section_keyword)
+            if start == -1:
+                return ''
+            start += 1
+
+        # The section runs up to (and keeps the newline before) the first blank line
+        end = config_data.find('\n\n', start)
+        if end != -1:
+            return config_data[start:end + 1]
+        section = config_data[start:]
+        return section[:-1] if section.endswith('\n') else section
 
     def parse_section(self, section_name, section_data):
         """
@@ -273,6 +342,32 @@ class AsaParser:
             logging.error(f"Failed to parse section {section_name}: {e}")
             return None
 
+    def to_dataframes(self):
+        """
+        Convert the parsed sections into pandas DataFrames.
+
+        Each section's rows are transposed into one list per column and the
+        DataFrame is built from those columns, so pandas infers one dtype per
+        column instead of discovering keys and boxing values row by row.
+
+        Returns:
+            dict: Section name -> DataFrame. Empty sections are omitted.
+
+        Notes:
+            - Columns are the union of every row's keys, in first-seen order, so
+              an error or placeholder first row does not drop later columns
+            - Rows missing a column (e.g. unparseable lines) get ''
+            - Call parse_file() first; returns {} if nothing was parsed
+        """
+        frames = {}
+        for section_name, rows in self.parsed_data.items():
+            if not rows:
+                continue
+            column_names = dict.fromkeys(chain.from_iterable(rows))
+            columns = {column: [row.get(column, '') for row in rows] for column in column_names}
+            frames[section_name] = pd.DataFrame(columns, copy=False)
+        return frames
+
     def get_hostname(self):
         """
         Get the hostname of the ASA device.
@@ -333,78 +428,84 @@ class AsaRunningConfigParser:
         """
         self.config_data = config_data
         self.objects_data = {}  # Dictionary to store parsed objects
-        self.access_lists = {}  # Dictionary to store parsed access lists, organized by ACL name
+        self.access_lists = defaultdict(list)  # Parsed access lists, organized by ACL name
         self.hostname = "unknown" # Initialize hostname
 
+        # ACL token -> handler used by parse_access_list
+        self._acl_token_handlers = {
+            'object': self._acl_object_token,
+            'object-group': self._acl_object_token,
+            'any': self._acl_any_token,
+            'eq': self._acl_port_token,
+        }
+        for protocol in _ACL_PROTOCOLS:
+            self._acl_token_handlers[protocol] = self._acl_protocol_token
+
     def parse(self):
         """Parse the running configuration."""
         try:
             parse = CiscoConfParse(self.config_data.splitlines(), syntax='asa')
+            sections = self.bucket_top_level_lines(parse)
             parsed_data = {}
+            # The section dumps below can be huge; skip building them unless DEBUG is on
+            debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
             # Extract general information
-            parsed_data['general'] = self.parse_general_info(parse)
+            parsed_data['general'] = self.parse_general_info(sections)
             # Store hostname found in general info
             if parsed_data['general']:
                  self.hostname = parsed_data['general'][0].get('Hostname', 'unknown')
 
-            logging.debug(f"General Info: {parsed_data['general']}")
+            if debug_enabled:
+                logging.debug("General Info: %r", parsed_data['general'])
 
             # Extract interface configurations
-            interfaces = parse.find_objects(r"^interface")
-            parsed_data['interfaces'] = [
-                self.parse_interface(interface)
-                for interface in interfaces
-            ]
-            logging.debug(f"Interfaces: {parsed_data['interfaces']}")
+            parsed_data['interfaces'] = list(map(self.parse_interface, sections['interface']))
+            if debug_enabled:
+                logging.debug("Interfaces: %r", parsed_data['interfaces'])
 
             # Extract routes
-            parsed_data['routes'] = self.parse_routes(parse)
-            logging.debug(f"Routes: {parsed_data['routes']}")
+            parsed_data['routes'] = self.parse_routes(sections)
+            if debug_enabled:
+                logging.debug("Routes: %r", parsed_data['routes'])
 
             # Extract access lists and store them in self.access_lists
-            access_lists = parse.find_objects(r"^access-list")
-            parsed_data['access_lists'] = []
-            for i, acl in enumerate(access_lists):
+            acl_lines = sections['access-list']
+            access_lists = parsed_data['access_lists'] = [None] * len(acl_lines)
+            acls_by_name = self.access_lists
+            for i, acl in enumerate(acl_lines):
                 parsed_acl = self.parse_access_list(acl, i + 1)
-                parsed_data['access_lists'].append(parsed_acl)
+                access_lists[i] = parsed_acl
 
                 # Store in self.access_lists dictionary using ACL name as key
-                acl_name = parsed_acl.get('ACL Name', '')
+                acl_name = parsed_acl.get('ACL Name')
                 if acl_name:
-                    if acl_name not in self.access_lists:
-                        self.access_lists[acl_name] = []
-                    self.access_lists[acl_name].append(parsed_acl)
-
-            logging.debug(f"Access Lists: {parsed_data['access_lists']}")
-
-            # Extract object definitions
-            objects = parse.find_objects(r"^object")
-            parsed_data['objects'] = [
-                entry
-                for obj in objects
-                for entry in self.parse_object(obj)
-            ]
-            logging.debug(f"Objects: {parsed_data['objects']}")
-
-            # Store objects in the instance variable
-            self.objects_data = {entry['Name']: entry for entry in parsed_data['objects']}
+                    acls_by_name[acl_name].append(parsed_acl)
+
+            if debug_enabled:
+                logging.debug("Access Lists: %r", parsed_data['access_lists'])
+
+            # Extract object definitions, storing them by name in the instance
+            # variable as they are produced
+            objects = parsed_data['objects'] = []
+            objects_data = self.objects_data = {}
+            for obj in sections['objects']:
+                for entry in self.parse_object(obj):
+                    objects.append(entry)
+                    if 'Name' in entry:  # Unparseable objects only carry the raw line
+                        objects_data[entry['Name']] = entry
+            if debug_enabled:
+                logging.debug("Objects: %r", parsed_data['objects'])
 
             # Extract NAT rules
-            nat_rules = parse.find_objects(r"^nat")
-            parsed_data['nat_rules'] = [
-                self.parse_nat_rule(nat)
-                for nat in nat_rules
-            ]
-            logging.debug(f"NAT Rules: {parsed_data['nat_rules']}")
+            parsed_data['nat_rules'] = list(map(self.parse_nat_rule, sections['nat']))
+            if debug_enabled:
+                logging.debug("NAT Rules: %r", parsed_data['nat_rules'])
 
             # Extract crypto map configurations
-            crypto_maps = parse.find_objects(r"^crypto map")
-            parsed_data['crypto_maps'] = [
-                self.parse_crypto_map(crypto)
-                for crypto in crypto_maps
-            ]
-            logging.debug(f"Crypto Maps: {parsed_data['crypto_maps']}")
+            parsed_data['crypto_maps'] = list(map(self.parse_crypto_map, sections['crypto map']))
+            if debug_enabled:
+                logging.debug("Crypto Maps: %r", parsed_data['crypto_maps'])
 
             logging.info("Running configuration parsed successfully.")
             return parsed_data
@@ -413,36 +514,73 @@ class AsaRunningConfigParser:
             logging.error(f"Failed to parse running configuration: {e}")
             raise
 
-    def parse_general_info(self, parse):
-        """Parse general information from the configuration."""
+    def bucket_top_level_lines(self, parse):
+        """
+        Group the top-level configuration lines by keyword in a single pass.
+
+        Each line is keyed on the keyword matched by _SECTION_KEYWORD_RE: its
+        first token, or its first two for qualified keywords such as
+        'crypto map'. A single compiled match per line replaces both
+        tokenizing the line and per-section regex scans. Objects and
+        object-groups are also collected together under 'objects' so their
+        configuration order is preserved.
+
+        Args:
+            parse: CiscoConfParse instance for the running configuration
+
+        Returns:
+            defaultdict: Keyword -> list of top-level CiscoConfParse objects
+        """
+        sections = defaultdict(list)
+        for obj in parse.objs:
+            if obj.is_child:
+                continue
+            match = _SECTION_KEYWORD_RE.match(obj.text)
+            if not match:
+                continue
+            keyword = match.group()
+            sections[keyword].append(obj)
+            if keyword in ('object', 'object-group'):
+                sections['objects'].append(obj)
+        return sections
+
+    def parse_general_info(self, sections):
+        """
+        Parse general information from the bucketed top-level lines.
+
+        The counts are the lengths of the buckets built once in parse(), so
+        they cost no extra pass over the configuration. Only the DNS server
+        list needs the parse tree (it lives in child lines).
+        """
         general_info = {}
 
         # Extract hostname
-        hostname_obj = parse.find_objects(r"^hostname")
+        hostname_obj = sections['hostname']
         general_info['Hostname'] = hostname_obj[0].text.split()[-1] if hostname_obj else ''
 
         # Extract version
-        version_obj = parse.find_objects(r"^ASA Version")
+        version_obj = sections['ASA Version']
         general_info['Version'] = version_obj[0].text.split()[-1] if version_obj else ''
 
         # Count interfaces
-        interfaces = parse.find_objects(r"^interface")
+        interfaces = sections['interface']
         general_info['# Interfaces'] = len(interfaces)
 
         # Count port-channels
-        port_channels = parse.find_objects(r"^interface Port-channel")
-        general_info['# Port Channels'] = len(port_channels)
+        general_info['# Port Channels'] = sum(
+            1 for i in interfaces if i.text.startswith('interface Port-channel')
+        )
 
         # Extract boot command
-        boot_obj = parse.find_objects(r"^boot system")
+        boot_obj = sections['boot system']
         general_info['Boot Command'] = boot_obj[0].text if boot_obj else ''
 
         # Extract timezone
-        timezone_obj = parse.find_objects(r"^clock timezone")
+        timezone_obj = sections['clock timezone']
         general_info['Timezone'] = ' '.join(timezone_obj[0].text.split()[2:]) if timezone_obj else ''
 
         # Extract DNS information
-        dns_servers = parse.find_objects(r"^dns server-group")
+        dns_servers = sections['dns server-group']
         dns_servers_list = []
         if dns_servers:
             for child in dns_servers[0].children:
@@ -450,34 +588,32 @@ class AsaRunningConfigParser:
                     dns_servers_list.append(child.text.split()[-1])
         general_info['DNS Servers'] = ', '.join(dns_servers_list)
 
-        domain_obj = parse.find_objects(r"^domain-name")
+        domain_obj = sections['domain-name']
         general_info['DNS Name'] = domain_obj[0].text.split()[-1] if domain_obj else ''
 
         # Count objects and object-groups
-        objects = parse.find_objects(r"^object ")
-        object_groups = parse.find_objects(r"^object-group")
-        general_info['# Objects'] = len(objects)
-        general_info['# Object-groups'] = len(object_groups)
+        general_info['# Objects'] = len(sections['object'])
+        general_info['# Object-groups'] = len(sections['object-group'])
 
         # Count access lists (excluding remarks)
         acl_count = 0
-        acl_entries = parse.find_objects(r"^access-list")
+        acl_entries = sections['access-list']
         for acl in acl_entries:
-            parts = acl.text.split()
+            # Only the first three tokens matter; don't tokenize the whole rule
+            parts = acl.text.split(None, 3)
             # Only count if it's not a remark line
             if len(parts) > 2 and parts[2] != 'remark':
                 acl_count += 1
         general_info['# Access List'] = acl_count
 
         # Count NAT rules
-        nat_rules = parse.find_objects(r"^nat")
-        general_info['# NAT'] = len(nat_rules)
+        general_info['# NAT'] = len(sections['nat'])
 
         # Count crypto tunnels (unique map numbers)
-        crypto_maps = parse.find_objects(r"^crypto map")
+        crypto_maps = sections['crypto map']
         map_numbers = set()
         for crypto_map in crypto_maps:
-            parts = crypto_map.text.split()
+            parts = crypto_map.text.split(None, 4)
             if len(parts) > 3:  # Ensure we have enough parts
                 try:
                     # Try to convert the third part to int to verify it's a number
@@ -490,42 +626,37 @@ class AsaRunningConfigParser:
 
         return [general_info]  # Return as list to maintain consistency with other sections
 
-    def parse_routes(self, parse):
-        """Parse static routes from the configuration."""
+    def parse_routes(self, sections):
+        """Parse static routes from the bucketed top-level lines."""
         routes = []
-        route_entries = parse.find_objects(r"^route")
-
-        for route in route_entries:
-            parts = route.text.split()
-            try:
-                interface = parts[1]
-                dest_network = parts[2]
-                dest_subnet = parts[3]
-                next_hop = parts[4]
-                admin_distance = parts[5] if len(parts) > 5 else '1'
-
-                routes.append({
-                    'Interface': interface,
-                    'Destination Network': dest_network,
-                    'Destination Subnet': dest_subnet,
-                    'Next Hop': next_hop,
-                    'Admin Distance': admin_distance
-                })
-            except IndexError as e:
-                logging.error(f"Failed to parse route: {route.text} - {e}")
+
+        for route in sections['route']:
+            match = _ROUTE_RE.match(route.text)
+            if not match:
+                logging.error(f"Failed to parse route: {route.text} - expected "
+                              "'route <interface> <network> <mask> <next hop> [distance]'")
                 continue
 
+            routes.append({
+                'Interface': match['interface'],
+                'Destination Network': match['network'],
+                'Destination Subnet': match['mask'],
+                'Next Hop': match['next_hop'],
+                'Admin Distance': match['distance'] or '1'
+            })
+
         return routes
 
     def parse_interface(self, interface):
         """Parse interface details into separate columns."""
         try:
-            ip_address_line = self.extract_child_value(interface, 'ip address')
+            children = self.index_children(interface)
+            ip_address_line = self.extract_child_value(interface, 'ip address', children)
             ip_address, subnet_mask, standby = self.split_ip_address(ip_address_line)
             return {
                 'Interface': interface.text.split()[-1],
-                'Nameif': self.extract_child_value(interface, 'nameif'),
-                'Security Level': self.extract_child_value(interface, 'security-level'),
+                'Nameif': self.extract_child_value(interface, 'nameif', children),
+                'Security Level': self.extract_child_value(interface, 'security-level', children),
                 'IP Address': ip_address,
                 'Subnet Mask': subnet_mask,
                 'CIDR': self.convert_to_cidr(subnet_mask),
@@ -550,16 +681,42 @@ class AsaRunningConfigParser:
             if not subnet_mask:
                 logging.warning("Empty subnet mask encountered.")
                 return ''
-            return sum(bin(int(x)).count('1') for x in subnet_mask.split('.'))
-        except ValueError as e:
+            return _mask_to_prefixlen(subnet_mask)
+        except (ValueError, IndexError) as e:
             logging.error(f"Failed to convert subnet mask to CIDR: {subnet_mask} - {e}")
             return ''
 
-    def extract_child_value(self, parent, keyword):
-        """Extract the value of a child line that starts with a specific keyword."""
+    def index_children(self, parent):
+        """
+        Index a parent's child lines by their first token.
+
+        Lets several keyword lookups on the same parent share one pass over
+        its children instead of re-walking and re-splitting them each time.
+
+        Returns:
+            defaultdict: First token -> stripped child lines, in config order
+        """
+        children = defaultdict(list)
         for child in parent.children:
-            if child.text.strip().startswith(keyword):
-                return child.text.split(maxsplit=1)[-1]
+            text = child.text.strip()
+            if text:
+                children[text.split(None, 1)[0]].append(text)
+        return children
+
+    def extract_child_value(self, parent, keyword, children=None):
+        """
+        Extract the value following the keyword of a parent's child line.
+
+        Args:
+            parent: CiscoConfParse object whose children are searched
+            keyword (str): Leading keyword(s) of the child line (e.g. 'ip address')
+            children (dict, optional): Prebuilt index from index_children()
+        """
+        if children is None:
+            children = self.index_children(parent)
+        for text in children.get(keyword.split(None, 1)[0], ()):
+            if text.startswith(keyword):
+                return text[len(keyword):].strip()
         logging.warning(f"Keyword '{keyword}' not found in parent: {parent.text}")
         return ''
 
@@ -597,8 +754,10 @@ class AsaRunningConfigParser:
         try:
             # Split the ACL line into parts for parsing
             parts = acl.text.split()
-            acl_name = parts[1] if len(parts) > 1 else ''
+            # ACL names repeat on every line of the ACL
+            acl_name = sys.intern(parts[1]) if len(parts) > 1 else ''
             acl_type = parts[2] if len(parts) > 2 else ''
+            acl_type = _ACL_INTERN.get(acl_type, acl_type)
 
             # Handle remark type ACLs differently
             if acl_type == 'remark':
@@ -622,75 +781,32 @@ class AsaRunningConfigParser:
             else:
                 # Parse regular ACL entries
                 action = parts[3] if len(parts) > 3 else ''
-                protocol = ''  # Initialize protocol as empty
-
-                # Initialize parsing variables
-                source, source_port, destination, destination_port = '', '', '', ''
-                log_status = 'disable' if 'disable' in parts else ''
-                inactive = 'Inactive' if 'inactive' in parts else ''
-
-                # Process parts after action
+                action = _ACL_INTERN.get(action, action)
+                flags = _ACL_FLAG_KEYWORDS.intersection(parts)
+                log_status = 'disable' if 'disable' in flags else ''
+                inactive = 'Inactive' if 'inactive' in flags else ''
+
+                # Walk the tokens after the action; each handler returns the
+                # index of the next token to examine
+                state = {
+                    'protocol': '',
+                    'source': '',
+                    'source_port': '',
+                    'destination': '',
+                    'destination_port': ''
+                }
+                get_handler = self._acl_token_handlers.get
+                part_count = len(parts)
                 i = 4  # Start after action instead of protocol
-                while i < len(parts):
-                    part = parts[i]
-
-                    # Skip keywords that don't need processing
-                    if part in ['log', 'disable', 'inactive']:
-                        i += 1
-                        continue
-
-                    # Handle object and object-group references
-                    if part in ['object', 'object-group']:
-                        if i + 1 < len(parts):
-                            obj_name = parts[i + 1]
-                            # Look up object type in objects_data dictionary
-                            if obj_name in self.objects_data:
-                                obj_type = self.objects_data[obj_name]['Object Type']
-
-                                # Handle protocol object-groups
-                                if obj_type in ['protocol', 'TCPUDP']:
-                                    source = obj_name  # Store protocol object as source
-                                # Network objects go to source/destination
-                                elif obj_type in ['network', 'network-object']:
-                                    if not source or source == protocol:  # If source is holding protocol, move to real source
-                                        source = obj_name
-                                    else:
-                                        destination = obj_name
-                                # Service objects go to port specifications
-                                elif obj_type in ['service', 'service-object', 'tcp', 'udp']:
-                                    if not destination_port:
-                                        destination_port = obj_name
-                                    elif not source_port:
-                                        source_port = obj_name
-                            else:
-                                # Default handling for unknown objects
-                                if not source or source == protocol:
-                                    source = obj_name
-                                else:
-                                    destination = obj_name
-                            i += 2  # Skip object name
-                            continue
-
-                    # Handle 'any' keyword in source/destination
-                    elif part == 'any':
-                        if not source or source == protocol:
-                            source = 'any'
-                        else:
-                            destination = 'any'
-
-                    # Handle explicit port specifications
-                    elif part == 'eq' and i + 1 < len(parts):
-                        if destination and not destination_port:
-                            destination_port = parts[i + 1]
-                        elif not source_port:
-                            source_port = parts[i + 1]
-                        i += 2  # Skip port number
-                        continue
-                    # Handle explicit protocols if specified
-                    elif part in ['ip', 'tcp', 'udp', 'icmp']:
-                        protocol = part
-
-                    i += 1
+                while i < part_count:
+                    handler = get_handler(parts[i])
+                    i = handler(state, parts, i) if handler else i + 1
+
+                protocol = state['protocol']
+                source = state['source']
+                source_port = state['source_port']
+                destination = state['destination']
+                destination_port = state['destination_port']
 
                 # Return the parsed ACL entry
                 return {
@@ -712,13 +828,70 @@ class AsaRunningConfigParser:
             logging.error(f"Failed to parse access list: {acl.text} - {e}")
             return {'Full Parsed Line': acl.text}
 
+    def _acl_object_token(self, state, parts, i):
+        """Handle an object/object-group reference in an ACL line."""
+        if i + 1 >= len(parts):
+            return i + 1
+        obj_name = sys.intern(parts[i + 1])  # Object names repeat across ACL entries
+        # Look up object type in objects_data dictionary
+        if obj_name in self.objects_data:
+            obj_type = self.objects_data[obj_name]['Object Type']
+
+            # Handle protocol object-groups
+            if obj_type in _ACL_PROTOCOL_OBJECT_TYPES:
+                state['source'] = obj_name  # Store protocol object as source
+            # Network objects go to source/destination
+            elif obj_type in _ACL_NETWORK_OBJECT_TYPES:
+                # If source is holding protocol, move to real source
+                if not state['source'] or state['source'] == state['protocol']:
+                    state['source'] = obj_name
+                else:
+                    state['destination'] = obj_name
+            # Service objects go to port specifications
+            elif obj_type in _ACL_SERVICE_OBJECT_TYPES:
+                if not state['destination_port']:
+                    state['destination_port'] = obj_name
+                elif not state['source_port']:
+                    state['source_port'] = obj_name
+        else:
+            # Default handling for unknown objects
+            if not state['source'] or state['source'] == state['protocol']:
+                state['source'] = obj_name
+            else:
+                state['destination'] = obj_name
+        return i + 2  # Skip object name
+
+    def _acl_any_token(self, state, parts, i):
+        """Handle the 'any' keyword in source/destination position."""
+        if not state['source'] or state['source'] == state['protocol']:
+            state['source'] = 'any'
+        else:
+            state['destination'] = 'any'
+        return i + 1
+
+    def _acl_port_token(self, state, parts, i):
+        """Handle an explicit 'eq <port>' specification."""
+        if i + 1 >= len(parts):
+            return i + 1
+        if state['destination'] and not state['destination_port']:
+            state['destination_port'] = parts[i + 1]
+        elif not state['source_port']:
+            state['source_port'] = parts[i + 1]
+        return i + 2  # Skip port number
+
+    def _acl_protocol_token(self, state, parts, i):
+        """Handle an explicit protocol keyword."""
+        state['protocol'] = _ACL_INTERN[parts[i]]
+        return i + 1
+
     def parse_object(self, obj):
         """Parse object into specified columns."""
         try:
-            obj_name = self.extract_object_name(obj)
-            obj_type = self.determine_object_type(obj)
-            description = self.extract_description(obj)
-            protocol = self.extract_protocol(obj)
+            parts = obj.text.split()
+            obj_name = self.extract_object_name(parts)
+            obj_type = self.determine_object_type(parts)
+            description = self.extract_description(obj, self.index_children(obj))
+            protocol = self.extract_protocol(parts)
             full_parsed_line = self.construct_full_parsed_line(obj)
 
             entries = []
@@ -740,90 +913,88 @@ class AsaRunningConfigParser:
             logging.error(f"Failed to parse object: {obj.text} - {e}")
             return [{'Full Parsed Line': obj.text}]
 
-    def extract_object_name(self, obj):
-        """Extract the object name."""
-        parts = obj.text.split()
+    def extract_object_name(self, parts):
+        """Extract the object name from the tokens of the object line."""
         return parts[2] if len(parts) > 2 else ''
 
-    def determine_object_type(self, obj):
-        """Determine the type of object or object-group."""
-        parts = obj.text.split()
-        if 'object-group' in parts:
-            index = parts.index('object-group')
-            return parts[index + 1] if len(parts) > index + 1 else 'object-group'
-        elif 'object network' in obj.text:
-            return 'network'
-        elif 'object service' in obj.text:
-            return 'service'
+    def determine_object_type(self, parts):
+        """Determine the type of object or object-group from its tokens."""
+        keyword = parts[0] if parts else ''
+        if keyword == 'object-group':
+            return parts[1] if len(parts) > 1 else 'object-group'
+        elif keyword == 'object' and len(parts) > 1:
+            if parts[1] == 'network':
+                return 'network'
+            elif parts[1] == 'service':
+                return 'service'
         return 'object'
 
-    def extract_protocol(self, obj):
-        """Extract protocol for object-group."""
-        parts = obj.text.split()
-        if 'object-group' in parts and len(parts) > 3:
+    def extract_protocol(self, parts):
+        """Extract protocol for object-group from its tokens."""
+        if parts and parts[0] == 'object-group' and len(parts) > 3:
             return parts[3]
         return ''
 
-    def extract_description(self, obj):
+    def extract_description(self, obj, children=None):
         """Extract description if present."""
-        for child in obj.children:
-            if 'description' in child.text:
-                return ' '.join(child.text.split()[1:])
+        if children is None:
+            children = self.index_children(obj)
+        descriptions = children.get('description')
+        if descriptions:
+            return ' '.join(descriptions[0].split()[1:])
         return ''
 
     def construct_full_parsed_line(self, obj):
         """Construct the full parsed line with parent and child objects."""
-        child_lines = ''.join([f"[{child.text}]" for child in obj.children])
-        return f"{obj.text} {child_lines}"
+        parts = [obj.text, ' ']
+        for child in obj.children:
+            parts += ('[', child.text, ']')
+        return ''.join(parts)
 
     def extract_object_details(self, child):
         """Extract object type and value from a child."""
         parts = child.text.split()
-        if 'network-object' in parts:
-            return 'network-object', parts[-1]
-        elif 'subnet' in parts:
-            return 'subnet', parts[-2]
-        elif 'host' in parts:
-            return 'host', parts[-1]
-        elif 'fqdn' in parts:
+        if not parts:
+            return '', ''
+        kind = parts[0]
+        if (kind == 'range' or (kind == 'port-object' and parts[1:2] == ['range'])) and len(parts) >= 3:
+            # Report both ends, e.g. 'port-object range 1000 2000' -> '1000-2000'
+            return kind, f'{parts[-2]}-{parts[-1]}'
+        if kind in _OBJECT_VALUE_INDEX:
+            return kind, parts[_OBJECT_VALUE_INDEX[kind]]
+        elif kind == 'fqdn':
             version = 'v4' if 'ipv4' in parts else 'v6'
             return f'FQDN {version}', parts[-1]
-        elif 'range' in parts:
-            return 'range', parts[-2]
-        elif 'port-object' in parts:
-            return 'port-object', parts[-1]
-        elif 'service-object' in parts:
+        elif kind == 'service-object':
             return 'service-object', ' '.join(parts[1:])
-        elif 'group-object' in parts:
-            return 'group-object', parts[1]
         return '', ''
 
     def parse_nat_rule(self, nat):
         """Parse NAT rule into multiple columns."""
-        try:
-            parts = nat.text.split()
-            return {
-                'Source': parts[2] if len(parts) > 2 else '',
-                'Destination': parts[4] if len(parts) > 4 else '',
-                'Translation': parts[6] if len(parts) > 6 else '',
-                'Options': ' '.join(parts[7:]) if len(parts) > 7 else '',
-                'Full Parsed Line': nat.text
-            }
-        except IndexError as e:
-            logging.error(f"Failed to parse NAT rule: {nat.text} - {e}")
+        match = _NAT_RE.match(nat.text)
+        if not match:
+            logging.error(f"Failed to parse NAT rule: {nat.text}")
             return {'Full Parsed Line': nat.text}
+        return {
+            'Source': match['source'] or '',
+            'Destination': match['destination'] or '',
+            'Translation': match['translation'] or '',
+            'Options': match['options'] or '',
+            'Full Parsed Line': nat.text
+        }
 
     def parse_crypto_map(self, crypto):
         """Parse crypto map into specified columns."""
         try:
-            parts = crypto.text.split()
-            map_name = parts[2] if len(parts) > 2 else ''
-            line_number = parts[3] if len(parts) > 3 else ''
-            match_address = self.extract_child_value(crypto, 'match address')
-            peer = self.extract_child_value(crypto, 'set peer')
+            match = _CRYPTO_MAP_RE.match(crypto.text)
+            map_name = (match and match['name']) or ''
+            line_number = (match and match['seq']) or ''
+            children = self.index_children(crypto)
+            match_address = self.extract_child_value(crypto, 'match address', children)
+            peer = self.extract_child_value(crypto, 'set peer', children)
             ike_version = 'ikev1' if 'ikev1' in crypto.text else 'ikev2'
-            transform_set = self.extract_child_value(crypto, 'set ikev1 transform-set')
-            applied_interface = self.extract_child_value(crypto, 'interface')
+            transform_set = self.extract_child_value(crypto, 'set ikev1 transform-set', children)
+            applied_interface = self.extract_child_value(crypto, 'interface', children)
             return {
                 'Line Number': line_number,
                 'Map Name': map_name,
@@ -6,28 +6,545 @@ from Cisco devices and creates formatted output.
 """
 
 import argparse
+import hashlib
 import logging
+import mmap
+import struct
 import re
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
-from ciscoconfparse2 import CiscoConfParse
-from tabulate import tabulate
+from collections import defaultdict
+from contextlib import nullcontext
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
 import ipaddress
 import sys
-from openpyxl import Workbook, load_workbook
 from apps.utils import ip_mask_to_cidr # Import the new utility
-from logging.handlers import TimedRotatingFileHandler
+from apps.workers import process_pool
 import json
 
 # Get module logger
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by every parser instance. The section header
+# patterns run over the raw bytes of the memory-mapped file, so whitespace is
+# limited to [^\S\n] to keep each match on a single line. Text patterns only
+# ever see ASCII-decoded sections and are compiled with re.ASCII.
+_NEXUS_HEADER_RE = re.compile(rb"^(?:`|')[^\S\n]*(show[^\S\n]+.*?)[^\S\n]*(?:`|')[^\S\n]*$", re.MULTILINE)
+_IOS_HEADER_RE = re.compile(rb"^(?:-{5,}|\*{5,}|={5,})[^\S\n]*(show[^\S\n]+.*?)[^\S\n]*(?:-{5,}|\*{5,}|={5,})[^\S\n]*$", re.MULTILINE)
+# Markers locating the show version output used to pick the header style,
+# and how much of the file after the marker is handed to _determine_device_type
+_VERSION_MARKERS = (b'`show version`', b'------------------ show version ------------------')
+_VERSION_PROBE_SIZE = 16384
+_HOSTNAME_RE = re.compile(r'^hostname\s+(\S+)', re.MULTILINE | re.ASCII)
+_IPV4_RE = re.compile(r'\d+\.\d+\.\d+\.\d+', re.ASCII)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+_SANITIZE_CHUNK_SIZE = 1 << 20  # Characters (or bytes) read per chunk by sanitize_file_content
+_PARALLEL_LISTING_MIN_FILES = 8  # find_cisco_files reads device info in a process pool from this many files
+# Port operators that take a value, and the protocols whose first port is the source port
+_ACL_PORT_OPERATORS = frozenset(('eq', 'gt', 'lt', 'neq'))
+_ACL_PORT_PROTOCOLS = frozenset(('tcp', 'udp'))
+# ACL wildcard mask (e.g. '0.0.0.255') to prefix length, for every valid prefix
+_WILDCARD_TO_PREFIX = {
+    str(ipaddress.IPv4Network(f'0.0.0.0/{prefixlen}').hostmask): prefixlen
+    for prefixlen in range(33)
+}
+_DIGITS_RE = re.compile(r'\d+', re.ASCII)
+_ETH_NUMBER_RE = re.compile(r'(?:eth(?:ernet)?)\s*(\d+/\d+(?:/\d+)?)', re.IGNORECASE | re.ASCII)
+_PO_NUMBER_RE = re.compile(r'(?:po(?:rt-channel)?)\s*(\d+)', re.IGNORECASE | re.ASCII)
+_VLAN_NUMBER_RE = re.compile(r'vlan\s*(\d+)', re.IGNORECASE | re.ASCII)
+_MGMT_NUMBER_RE = re.compile(r'(?:mgmt(?:mt)?)\s*(\d+/\d+)', re.IGNORECASE | re.ASCII)
+# (lower-case name prefixes, number pattern, canonical prefix) for _normalize_interface
+_INTERFACE_NAME_RULES = (
+    (('eth', 'ethernet'), _ETH_NUMBER_RE, 'Ethernet'),
+    (('po', 'port-channel'), _PO_NUMBER_RE, 'port-channel'),
+    (('vlan',), _VLAN_NUMBER_RE, 'Vlan'),
+    (('mgmt', 'management'), _MGMT_NUMBER_RE, 'mgmt'),
+)
+_PO_NAME_NUMBER_RE = re.compile(r'port-channel(\d+)', re.IGNORECASE | re.ASCII)
+_VLAN_NAME_NUMBER_RE = re.compile(r'vlan(\d+)', re.IGNORECASE | re.ASCII)
+
+# Nexus 'show interface brief' header keyword -> section type, checked in order
+_NEXUS_BRIEF_SECTIONS = (('Ethernet', 'ethernet'), ('Port-channel', 'portchannel'))
+# Fixed-width column layout, {'column': (start, end)}, of each Nexus brief section type
+_NEXUS_BRIEF_COLUMNS = {
+    'ethernet': {
+        'interface': (0, 13),  # Ethernet takes up about 13 chars
+        'vlan': (13, 21),      # VLAN takes up about 8 chars
+        'type': (21, 26),      # Type takes up about 5 chars
+        'mode': (26, 33),      # Mode takes up about 7 chars
+        'status': (33, 41),    # Status takes up about 8 chars
+        'reason': (41, 65),    # Reason takes up about 24 chars
+        'speed': (65, 75),     # Speed takes up about 10 chars
+        'port_ch': (75, 80),   # Port Ch # takes the rest
+    },
+    'portchannel': {
+        'interface': (0, 13),
+        'vlan': (13, 21),
+        'type': (21, 26),
+        'mode': (26, 33),
+        'status': (33, 41),
+        'reason': (41, 65),
+        'speed': (65, 73),
+        'port_ch': (73, 80),   # Protocol field
+    },
+    'vlan': {
+        'interface': (0, 10),
+        'vlan': (10, 45),      # Secondary VLAN(Type) field
+        'status': (45, 53),
+        'reason': (53, 80),
+    },
+    'mgmt': {
+        'interface': (0, 7),
+        'vrf': (7, 19),
+        'status': (19, 28),
+        'ip': (28, 65),
+        'speed': (65, 73),
+        'mtu': (73, 80),
+    },
+}
+
+# 'show interfaces' fields, matched per interface section in _update_interface_status
+_IF_SECTION_SPLIT_RE = re.compile(r'\n(?=\S+? is)', re.ASCII)
+_IF_STATUS_RE = re.compile(r'(\S+?) is (.*?), line protocol is (\S+)', re.ASCII)
+_IF_HARDWARE_RE = re.compile(r'Hardware is (.*?), address is (\S+)(?:\s+\(bia (\S+)\))?', re.ASCII)
+_IF_LINK_INFO_RE = re.compile(r'((?:Auto|Full|Half)-duplex), (\d+(?:\.\d+)?[MG]b/s)(?:, link type is ([\w-]+))?,?\s*(?:media type is ((?:[\w-]+(?:/[\w-]+)*)+(?:\s+[\w-]+)*(?:\s+SFP)?))(?:\s*$|\n)', re.ASCII)
+_IF_FLOW_CONTROL_RE = re.compile(r'input flow-control is (\w+), output flow-control is (\w+)', re.ASCII)
+_IF_MTU_RE = re.compile(r'MTU (\d+) bytes, BW (\d+) Kbit/sec, DLY (\d+) usec', re.ASCII)
+_IF_LOAD_RE = re.compile(r'reliability (\d+)/\d+, txload (\d+)/\d+, rxload (\d+)/\d+', re.ASCII)
+# Counter lines that start with a number, as one alternation so the section is
+# scanned once rather than once per counter. The outer named group of each
+# alternative is the match's lastgroup.
+_IF_COUNTERS_RE = re.compile(
+    r'(?P<count>\d+) (?:'
+    r'(?P<input_rate>minute input rate (?P<input_bps>\d+) bits/sec)'
+    r'|(?P<output_rate>minute output rate (?P<output_bps>\d+) bits/sec)'
+    r'|(?P<packets_input>packets input,\s*(?P<input_bytes>\d+) bytes)'
+    r'|(?P<packets_output>packets output,\s*(?P<output_bytes>\d+) bytes)'
+    r'|(?P<input_errors>input errors,\s*(?P<crc>\d+) CRC,\s*(?P<frame>\d+) frame,\s*(?P<overrun>\d+) overrun)'
+    r'|(?P<output_errors>output errors)'
+    r'|(?P<interface_resets>interface resets)'
+    r'|(?P<lost_carrier>lost carrier, (?P<no_carrier>\d+) no carrier)'
+    r')', re.ASCII)
+# Output counters only count after their input counterpart, as input and
+# output are reported as a pair
+_IF_COUNTER_PRECEDED_BY = {'output_rate': 'input_rate', 'packets_output': 'packets_input'}
+_IF_BROADCAST_RE = re.compile(r'Received (\d+) broadcasts \((\d+) multicasts\)', re.ASCII)
+_IF_QUEUE_DROPS_RE = re.compile(r'Input queue: (\d+)/\d+/(\d+)/\d+ \(size/max/drops/flushes\); Total output drops: (\d+)', re.ASCII)
+_IF_ENCAPSULATION_RE = re.compile(r'Encapsulation (\w+)', re.ASCII)
+_IF_ARP_TIMEOUT_RE = re.compile(r'ARP Timeout (\d{2}:\d{2}:\d{2})', re.ASCII)
+_IF_LAST_IO_RE = re.compile(r'Last input ([\w\d:]+), output ([\w\d:]+), output hang ([\w\d:]+)', re.ASCII)
+_IF_QUEUEING_RE = re.compile(r'Queueing strategy: (\w+)', re.ASCII)
+
+# show version body (IOS '---- show version ----' banner or Nexus command echo)
+# and the (pattern, device type) rules applied to it in order by _determine_device_type
+_IOS_VERSION_RE = re.compile(r'-{18,}\s*show\s+version\s*-+\n(.*?)(?=\n-{18,}|\Z)', re.DOTALL | re.MULTILINE | re.ASCII)
+_NEXUS_VERSION_RE = re.compile(r'(?:^|\n)(?:`show\s+version\s*`|show\s+version\s*\n)(.*?)(?=\n`show|\nshow\s|$)', re.DOTALL | re.ASCII)
+_DEVICE_TYPE_RULES = (
+    (re.compile(r'NX-OS|Nexus', re.IGNORECASE | re.ASCII), "Nexus Switch"),
+    (re.compile(r'IOS-XE.*Catalyst|Catalyst.*IOS-XE', re.IGNORECASE | re.ASCII), "Catalyst Switch"),
+    (re.compile(r'IOS-XE', re.IGNORECASE | re.ASCII), "IOS-XE Router"),
+    (re.compile(r'IOS Software', re.IGNORECASE | re.ASCII), "IOS Router"),
+)
+
+# show interfaces trunk rows: the port/mode/encapsulation/status/native VLAN
+# row and the port/VLAN list rows of the later sub-tables
+_TRUNK_INTERFACE_RE = re.compile(r'^(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)', re.ASCII)
+_TRUNK_VLAN_RE = re.compile(r'^(\S+)\s+(.+)$', re.ASCII)
+
+# show cdp neighbors detail: entry boundaries and the per-entry fields
+_CDP_ENTRY_SPLIT_RE = re.compile(r'\n(?=-{3,}|\s*Device ID:)')
+_CDP_DEVICE_ID_RE = re.compile(r"(?:Device ID:|Device ID\s*:\s*)(.*?)(?:\(|\n|$)", re.IGNORECASE | re.MULTILINE)
+_CDP_INTERFACE_RE = re.compile(r"Interface:\s*([\w\-/\.]+)[,\s]*Port ID \(outgoing port\):\s*(.*?)(?:\n|$)", re.IGNORECASE | re.MULTILINE)
+_CDP_PLATFORM_RE = re.compile(r"Platform:\s*(.*?)(?:,|\n|$)", re.IGNORECASE | re.MULTILINE)
+_CDP_CAPABILITIES_RE = re.compile(r"Capabilities:\s*(.*?)(?:\n|$)", re.IGNORECASE | re.MULTILINE)
+_CDP_IP_RE = re.compile(r"(?:Management address|IP address|IPv4 address):\s*([\d\.]+)", re.IGNORECASE | re.MULTILINE)
+_CDP_VERSION_RE = re.compile(r"(?:Software Version|Version|Cisco IOS Software).*?[\r\n]+\s*(.*?)(?:\n\n|\n(?=[A-Z])|advertisement|Configuration|Copyright|\Z)", re.DOTALL | re.IGNORECASE)
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Prefixes of the interface child lines _parse_interfaces acts on; most child
+# lines (spanning-tree, storm-control, speed, ...) fail this one tuple test
+# and skip the whole keyword chain
+_INTERFACE_CHILD_PREFIXES = ("description", "switchport", "channel-group", "no switchport", "ip address")
+
+# Default row for a parsed interface, in export column order; each interface
+# starts as a copy of this instead of building the dict key by key
+_INTERFACE_TEMPLATE = {
+    "Host": "",  # Hostname, first column
+    "if_name": "",
+    "type": "",
+    "mode": "access",  # Default mode is access
+    "vlan": "",
+    "allowed_trunks": "",
+    "admin_state": "",
+    "protocol_status": "",
+    "speed": "",
+    "duplex": "",
+    "media_type": "",
+    "link_type": "",
+    "flow_control_in": "",
+    "flow_control_out": "",
+    "port_channel": "",
+    "description": "",
+    "ip_cidr": "",
+    "hardware_type": "",
+    "mac_address": "",
+    "bia_address": "",  # Burned In Address
+    "mtu": "",
+    "bandwidth": "",
+    "delay": "",
+    "reliability": "",
+    "txload": "",
+    "rxload": "",
+    "encapsulation": "",
+    "arp_timeout": "",
+    "last_input": "",
+    "last_output": "",
+    "last_output_hang": "",
+    "queue_strategy": "",
+    "input_rate (bps)": "",
+    "output_rate (bps)": "",
+    "input_packets": "",
+    "input_bytes": "",
+    "output_packets": "",
+    "output_bytes": "",
+    "input_errors": "",
+    "output_errors": "",
+    "crc_errors": "",
+    "frame_errors": "",
+    "overrun_errors": "",
+    "unknown_protocols": "",
+    "broadcasts_received": "",
+    "multicasts_received": "",
+    "input_drops": "",
+    "output_drops": "",
+    "interface_resets": "",
+    "carrier_transitions": "",
+}
+
+# Opt-in on-disk cache of extracted sections so re-runs over an unchanged file
+# skip the section scan; enabled by setting CISCO_IF_PARSER_CACHE=1. Entries
+# are plain JSON. Bump the version whenever the cached entry layout or what
+# section extraction produces changes, so entries from older builds are ignored.
+_DISK_CACHE_ENV = 'CISCO_IF_PARSER_CACHE'
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'cisco_if_parser')
+_DISK_CACHE_VERSION = 2
+_DISK_CACHE_MAX_ENTRIES = 64
+# Files whose sections (and split running-config) are kept in memory; the
+# least recently used file is dropped beyond this
+_MEMORY_CACHE_MAX_ENTRIES = 64
+
+
+def _file_signature(show_tech_file: str) -> Optional[Tuple[str, int, int]]:
+    """Identify a file's current contents by absolute path, mtime and size."""
+    try:
+        stat = os.stat(show_tech_file)
+    except OSError:
+        return None
+    return os.path.abspath(show_tech_file), stat.st_mtime_ns, stat.st_size
+
+
+def _disk_cache_enabled() -> bool:
+    """Return True when the on-disk section cache has been switched on."""
+    return os.environ.get(_DISK_CACHE_ENV, '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def _disk_cache_key(signature: Optional[Tuple[str, int, int]]) -> Optional[str]:
+    """Build the on-disk cache key for a file, or None when the disk cache is off."""
+    if signature is None or not _disk_cache_enabled():
+        return None
+    key = "{}:{}:{}:{}".format(_DISK_CACHE_VERSION, *signature)
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(cache: Dict, key):
+    """Look up a bounded in-memory cache entry, marking it most recently used."""
+    value = cache.pop(key, None)
+    if value is not None:
+        cache[key] = value
+    return value
+
+
+def _cache_put(cache: Dict, key, value) -> None:
+    """Store a bounded in-memory cache entry, dropping the least recently used ones."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > _MEMORY_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+
+def _load_disk_cache(key: Optional[str]) -> Optional[Dict]:
+    """Load a cached section entry from disk, returning None on a miss."""
+    if not key:
+        return None
+    cache_path = os.path.join(_DISK_CACHE_DIR, key)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        os.utime(cache_path)  # Mark as recently used for eviction
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable cache entry %s: %s", cache_path, e)
+        return None
+    # Only accept entries of the current version holding string sections
+    if (not isinstance(entry, dict)
+            or entry.get('version') != _DISK_CACHE_VERSION
+            or not isinstance(entry.get('sections'), dict)
+            or not all(isinstance(k, str) and isinstance(v, str) for k, v in entry['sections'].items())
+            or not isinstance(entry.get('device_type'), str)
+            or not isinstance(entry.get('hostname'), str)):
+        logger.debug("Ignoring malformed cache entry %s", cache_path)
+        return None
+    return {'sections': entry['sections'], 'device_type': entry['device_type'], 'hostname': entry['hostname']}
+
+
+def _store_disk_cache(key: Optional[str], entry: Dict) -> None:
+    """Atomically write a section entry to the disk cache and evict the oldest entries."""
+    if not key:
+        return
+    cache_path = os.path.join(_DISK_CACHE_DIR, key)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(entry, version=_DISK_CACHE_VERSION), f)
+        os.replace(tmp_path, cache_path)
+
+        entries = [e for e in os.scandir(_DISK_CACHE_DIR) if e.is_file() and not e.name.endswith('.tmp')]
+        if len(entries) > _DISK_CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda e: e.stat().st_mtime_ns)
+            for stale in entries[:len(entries) - _DISK_CACHE_MAX_ENTRIES]:
+                os.remove(stale.path)
+    except OSError as e:
+        logger.debug("Could not write section cache %s: %s", cache_path, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _find_first(data, markers: Tuple[bytes, ...]) -> int:
+    """
+    Return the offset of the earliest occurrence of any marker in data.
+
+    Args:
+        data: Raw file contents (bytes or a read-only mmap of the file)
+        markers (Tuple[bytes, ...]): Byte strings to look for
+
+    Returns:
+        int: Offset of the first marker found, or -1 if none occur
+
+    Notes:
+        Each search after a hit is bounded by that hit, so a marker missing
+        from the file (e.g. the Nexus one in an IOS show tech) only scans
+        up to the first match instead of the whole file.
+    """
+    first = -1
+    for marker in markers:
+        end = len(data) if first == -1 else first + len(marker) - 1
+        pos = data.find(marker, 0, end)
+        if pos != -1:
+            first = pos
+    return first
+
+
+def _split_sections(data, header_pattern: re.Pattern) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (command, content) pairs for each header-delimited section.
+
+    Args:
+        data: Raw file contents (bytes or a read-only mmap of the file)
+        header_pattern (re.Pattern): Compiled bytes pattern matching a header line,
+                                     with the show command as group 1
+
+    Returns:
+        Iterator[Tuple[str, str]]: Show command and its non-empty output, decoded
+                                   as ASCII with line endings normalised
+    """
+    # Walk the headers lazily, emitting each section once the next header (or
+    # the end of the file) bounds it, so no list of matches is built up front
+    previous = None
+    for match in chain(header_pattern.finditer(data), (None,)):
+        if previous is not None:
+            start = previous.end() + 1  # Skip the header line's newline
+            end = match.start() if match is not None else len(data)
+            content = data[start:end].decode('ascii', errors='ignore')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            if content.endswith('\n'):
+                content = content[:-1]
+            if content:
+                yield previous.group(1).decode('ascii', errors='ignore'), content
+        previous = match
+
+
+def _iter_interface_status(text: str) -> Iterator[Tuple[re.Match, int, int]]:
+    """
+    Yield the status line match and bounds of each interface in show interfaces output.
+
+    Args:
+        text (str): 'show interfaces' output
+
+    Returns:
+        Iterator[Tuple[re.Match, int, int]]: Match of the "<name> is ..., line protocol
+                                             is ..." line and the [start, end) offsets
+                                             of that interface's section in text
+
+    Notes:
+        A section starts at every line beginning "<word> is"; sections whose
+        first line is not a status line are skipped. Status lines are matched
+        in place, so callers only slice the sections they actually use.
+    """
+    start = 0
+    for boundary in chain(_IF_SECTION_SPLIT_RE.finditer(text), (None,)):
+        end = boundary.start() if boundary is not None else len(text)
+        name_match = _IF_STATUS_RE.match(text, start, end)
+        if name_match:
+            yield name_match, start, end
+        if boundary is not None:
+            start = boundary.end()
+
+
+@lru_cache(maxsize=16)
+def _column_layout(columns: Tuple[Tuple[str, Tuple[int, int]], ...]) -> Tuple[struct.Struct, Tuple[str, ...]]:
+    """
+    Build a struct layout that unpacks fixed-width columns from an encoded line.
+
+    Args:
+        columns: (field, (start, end)) pairs in ascending, non-overlapping order,
+                 as produced by _get_column_positions
+
+    Returns:
+        Tuple[struct.Struct, Tuple[str, ...]]: Layout with one bytes field per
+                                               column, and the matching field names
+    """
+    fmt = []
+    pos = 0
+    for field, (start, end) in columns:
+        if start < pos:
+            raise ValueError(f"Column {field} overlaps the previous column")
+        if start > pos:
+            fmt.append(f"{start - pos}x")
+        fmt.append(f"{end - start}s")
+        pos = end
+    return struct.Struct(''.join(fmt)), tuple(field for field, _ in columns)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_interface(if_name: str) -> str:
+    """
+    Normalize an interface name; backs CiscoInterfaceParser._normalize_interface_name.
+
+    Interface names repeat across the running-config, brief and detail output,
+    so results are memoized. The cache is sized for a large chassis seen in
+    several spellings: each pass touches every name in order, so an LRU smaller
+    than the distinct names evicts entries just before the next pass needs them.
+
+    Args:
+        if_name (str): Raw interface name (e.g., 'eth1/1', 'Po10', 'vlan 20')
+
+    Returns:
+        str: Normalized interface name, or the stripped input if no rule applies
+    """
+    # Strip any leading/trailing whitespace
+    if_name = if_name.strip()
+
+    # Fast path: names already in canonical form come back unchanged, so
+    # skip the regex for them
+    if if_name.startswith('Ethernet'):
+        slots = if_name[8:].split('/')
+        if 2 <= len(slots) <= 3 and all(slot.isdecimal() for slot in slots):
+            return if_name
+    elif if_name.startswith('port-channel') and if_name[12:].isdecimal():
+        return if_name
+    elif if_name.startswith('Vlan') and if_name[4:].isdecimal():
+        return if_name
+
+    # The first rule whose prefix matches decides the result
+    if_name_lower = if_name.lower()
+    for prefixes, number_pattern, canonical_prefix in _INTERFACE_NAME_RULES:
+        if if_name_lower.startswith(prefixes):
+            match = number_pattern.search(if_name)
+            if match:
+                return f"{canonical_prefix}{match.group(1)}"
+            break
+
+    # Return original name if no normalization needed
+    return if_name
+
+
+def _acl_sort_key(acl_id: str) -> Tuple:
+    """Sort key listing numbered ACLs in numeric order (1, 10, 99, 100) before named ones."""
+    return (0, int(acl_id)) if acl_id.isdecimal() else (1, acl_id)
+
+
+def _iter_interface_blocks(lines: List[str]) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield (interface line, child lines) for each top-level interface block.
+
+    Mirrors the parent/child view CiscoConfParse gives for '^interface' objects
+    without building its object model: blank and '!' comment lines are skipped,
+    a block ends at the next unindented line, and only direct children are
+    kept (lines nested under a child are dropped).
+
+    Args:
+        lines (List[str]): Running-config lines
+
+    Returns:
+        Iterator[Tuple[str, List[str]]]: Interface line and its direct child lines
+    """
+    header = None
+    children: List[str] = []
+    child_indent = None
+    for line in lines:
+        body = line.lstrip()
+        if not body or body[0] == '!':
+            continue
+        if body is not line:  # Indented line
+            if header is not None:
+                indent = len(line) - len(body)
+                if child_indent is None or indent <= child_indent:
+                    children.append(line)
+                    child_indent = indent
+            continue
+        if header is not None:
+            yield header, children
+            header = None
+        if line.startswith('interface'):
+            header = line
+            children = []
+            child_indent = None
+    if header is not None:
+        yield header, children
+
+
+def _read_device_info(path: str) -> Tuple[Optional[Tuple[str, int, int]], Dict]:
+    """
+    Read one file's sections, in a worker process when listing files.
+
+    Returns:
+        Tuple: The file signature, or None when the extraction failed and must not
+               be cached, and the section cache entry (sections, device type, hostname)
+    """
+    parser = CiscoConfigParser(path)
+    entry = {
+        'sections': parser.sections,
+        'device_type': parser.device_type,
+        'hostname': parser.hostname
+    }
+    cached = parser._signature is not None and parser._signature in CiscoConfigParser._section_cache
+    return (parser._signature if cached else None), entry
+
+
 class CiscoConfigParser:
     """Base class for Cisco configuration parsers"""
 
-    # Class-level cache for storing parsed sections
+    # Class-level LRU caches keyed by file signature (path, mtime, size), so an
+    # edited or replaced file is re-extracted: the parsed sections, and each
+    # file's (running-config, lines) split on first use
     _section_cache = {}
+    _config_lines_cache = {}
 
     def __init__(self, show_tech_file: str):
         """
@@ -44,17 +561,29 @@ class CiscoConfigParser:
         self.sections: Dict[str, str] = {} # Store extracted sections
         self.show_interfaces = None  # Initialize show interfaces
         self.show_interfaces_brief = None  # Initialize show interfaces brief
+        self._signature = _file_signature(show_tech_file)
+
+        # Check if file has already been parsed, in this process or a previous run
+        disk_cache_key = None
+        cache = _cache_get(self._section_cache, self._signature) if self._signature else None
+        if cache is not None:
+            logger.debug(f"Using cached sections for {show_tech_file}")
+        else:
+            disk_cache_key = _disk_cache_key(self._signature)
+            cache = _load_disk_cache(disk_cache_key)
+            if cache is not None:
+                logger.debug(f"Using on-disk cached sections for {show_tech_file}")
+                _cache_put(self._section_cache, self._signature, cache)
 
-        # Check if file has already been parsed
-        if show_tech_file in self._section_cache:
-            cache = self._section_cache[show_tech_file]
+        if cache is not None:
             self.sections = cache['sections'] # Load sections from cache
             self.running_config = self.sections.get('show running-config') or self.sections.get('show running') # Try both keys
+            self.show_interfaces = self.sections.get('show interfaces')
+            self.show_interfaces_brief = self.sections.get('show interfaces brief')
             self.device_type = cache['device_type']
             self.hostname = cache['hostname']
-            logger.debug(f"Using cached sections for {show_tech_file}")
         else:
-            self._extract_sections() # Call the refactored extraction method
+            extracted = self._extract_sections() # Call the refactored extraction method
             # Populate main attributes after extraction
             self.running_config = self.sections.get('show running-config') or self.sections.get('show running')
             if self.running_config:
@@ -69,12 +598,35 @@ class CiscoConfigParser:
                 else:
                     self.device_type = "Unknown" # Fallback if no version or running-config
 
-            # Cache the extracted sections and derived info
-            self._section_cache[self.show_tech_file] = {
-                'sections': self.sections,
-                'device_type': self.device_type,
-                'hostname': self.hostname
-            }
+            # Cache the extracted sections and derived info; a failed extraction
+            # may have left partial sections, so it is never cached
+            if extracted:
+                cache = {
+                    'sections': self.sections,
+                    'device_type': self.device_type,
+                    'hostname': self.hostname
+                }
+                if self._signature:
+                    _cache_put(self._section_cache, self._signature, cache)
+                if self.sections:
+                    _store_disk_cache(disk_cache_key, cache)
+
+    @property
+    def _config_lines(self) -> List[str]:
+        """
+        The running-config split into lines.
+
+        Split on first use and shared by every parser of the same file, so
+        listing files (which only needs hostname and device type) never
+        splits the config and the interface and ACL parsers split it once.
+        """
+        key = self._signature or self.show_tech_file
+        cached = _cache_get(self._config_lines_cache, key)
+        if cached is not None and cached[0] is self.running_config:
+            return cached[1]
+        lines = self.running_config.splitlines() if self.running_config else []
+        _cache_put(self._config_lines_cache, key, (self.running_config, lines))
+        return lines
 
     def _extract_hostname_from_running_config(self) -> None:
         """Extract hostname specifically from the running-config section."""
@@ -83,8 +635,7 @@ class CiscoConfigParser:
             logger.warning("Cannot extract hostname, running_config is missing.")
             logger.info("END - Extracting hostname from configuration (no running config)")
             return
-        hostname_pattern = re.compile(r'^hostname\s+(\S+)', re.MULTILINE)
-        hostname_match = hostname_pattern.search(self.running_config)
+        hostname_match = _HOSTNAME_RE.search(self.running_config)
         if hostname_match:
             self.hostname = hostname_match.group(1)
             logger.info(f"Found hostname from running-config: {self.hostname}")
@@ -109,84 +660,48 @@ class CiscoConfigParser:
         
         return "Unknown Cisco Device" # Default if no specific clues found
 
-    def _extract_sections(self) -> None:
-        """Extract sections based on header patterns like '--- show command ---'."""
+    def _extract_sections(self) -> bool:
+        """
+        Extract sections based on header patterns like '--- show command ---'.
+
+        Returns:
+            bool: True if the whole file was scanned; False if extraction failed
+                  part-way and self.sections may be incomplete
+        """
         logger.info("START - Extracting sections from show tech file")
         self.sections = {}
         found_commands = [] # Log commands found
+        extracted = False
 
-        # Determine device type first by reading just the version section
         try:
-            with open(self.show_tech_file, 'r', encoding='ascii', errors='ignore') as f:
-                # Read chunks to find show version section
-                chunk_size = 8192  # 8KB chunks
-                content = ""
-                version_found = False
-                
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    content += chunk
-                    
-                    # Try to find version section in accumulated content
-                    if '`show version`' in content or '------------------ show version ------------------' in content:
-                        version_found = True
-                        break
-                    
-                    # Keep only the last chunk in case the pattern spans chunks
-                    if len(content) > chunk_size * 2:
-                        content = content[-chunk_size:]
-
-                if not version_found:
-                    logger.warning("Could not find version section in first pass")
-                    self.device_type = "Unknown Cisco Device"
-                else:
-                    self.device_type = _determine_device_type(content)
-
-            # Now process the file based on device type
-            header_pattern = None
-            if self.device_type == "Nexus Switch":
-                header_pattern = r"^(?:`|')\s*(show\s+.*?)\s*(?:`|')\s*$"
-                logger.debug("Using Nexus pattern for section extraction")
-            else:
-                header_pattern = r"^(?:-{5,}|\*{5,}|={5,})\s*(show\s+.*?)\s*(?:-{5,}|\*{5,}|={5,})\s*$"
-                logger.debug("Using IOS pattern for section extraction")
-
-            # Process file in chunks for section extraction
-            with open(self.show_tech_file, 'r', encoding='ascii', errors='ignore') as f:
-                current_command = None
-                current_content = []
-                
-                for line in f:
-                    line = line.rstrip('\n')
-                    
-                    # Check if line matches header pattern
-                    match = re.match(header_pattern, line)
-                    if match:
-                        # Save previous section if exists
-                        if current_command:
-                            section_content = '\n'.join(current_content)
-                            if section_content:
-                                self.sections[current_command] = section_content
-                                logger.debug(f"Extracted section: '{current_command}' ({len(section_content)} chars)")
-                                found_commands.append(current_command)
-                            
-                        # Start new section
-                        current_command = match.group(1)
-                        current_content = []
-                        continue
-                    
-                    # Add line to current section if we're in one
-                    if current_command:
-                        current_content.append(line)
-
-                # Save last section
-                if current_command and current_content:
-                    section_content = '\n'.join(current_content)
-                    self.sections[current_command] = section_content
-                    logger.debug(f"Extracted section: '{current_command}' ({len(section_content)} chars)")
-                    found_commands.append(current_command)
+            # Map the file once; the version probe and the section scan both
+            # work on the same read-only mapping instead of reading it twice
+            with open(self.show_tech_file, 'rb') as f:
+                with (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                      if os.fstat(f.fileno()).st_size else nullcontext(b'')) as data:
+                    # Determine device type first from the show version section
+                    start = _find_first(data, _VERSION_MARKERS)
+                    if start == -1:
+                        logger.warning("Could not find version section in first pass")
+                        self.device_type = "Unknown Cisco Device"
+                    else:
+                        version_window = data[start:start + _VERSION_PROBE_SIZE].decode('ascii', errors='ignore')
+                        self.device_type = _determine_device_type(version_window.replace('\r\n', '\n'))
+
+                    # Now process the file based on device type
+                    if self.device_type == "Nexus Switch":
+                        header_pattern = _NEXUS_HEADER_RE
+                        logger.debug("Using Nexus pattern for section extraction")
+                    else:
+                        header_pattern = _IOS_HEADER_RE
+                        logger.debug("Using IOS pattern for section extraction")
+
+                    # Slice sections out of the mapping in place rather than
+                    # decoding and joining the file line by line
+                    for command, section_content in _split_sections(data, header_pattern):
+                        self.sections[command] = section_content
+                        logger.debug("Extracted section: '%s' (%s chars)", command, len(section_content))
+                        found_commands.append(command)
 
             if not self.sections:
                 logger.warning(f"No sections extracted using header patterns. File might have unexpected format: {self.show_tech_file}")
@@ -196,6 +711,7 @@ class CiscoConfigParser:
             self.show_interfaces_brief = self.sections.get('show interfaces brief')
             logger.debug(f"Found show interfaces section: {'Yes' if self.show_interfaces else 'No'}")
             logger.debug(f"Found show interfaces brief section: {'Yes' if self.show_interfaces_brief else 'No'}")
+            extracted = True
 
         except FileNotFoundError:
             logger.error(f"Show tech file not found: {self.show_tech_file}")
@@ -206,6 +722,7 @@ class CiscoConfigParser:
 
         logger.info(f"Finished section extraction. Found commands: {found_commands}") # Log all found commands at the end
         logger.info("END - Extracting sections from show tech file")
+        return extracted
 
     def get_hostname(self):
         """Return the hostname found during parsing."""
@@ -278,6 +795,63 @@ class CiscoACLParser(CiscoConfigParser):
             flat_acl_data = [item for sublist in self.acls.values() for item in sublist]
             self.parsed_data['Access Lists'] = flat_acl_data # Use sheet name as key
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _convert_wildcard_to_cidr(ip: str, wildcard: str) -> str:
+        """
+        Convert an address and ACL wildcard mask to CIDR notation.
+
+        Args:
+            ip (str): Address in dotted decimal format (e.g., '10.1.0.0')
+            wildcard (str): Wildcard mask in dotted decimal format (e.g., '0.0.255.255')
+
+        Returns:
+            str: The address in CIDR notation (e.g., '10.1.0.0/16'). Wildcards that
+                 do not correspond to a prefix length, or invalid addresses, are
+                 returned unchanged as '<ip> <wildcard>'.
+
+        Notes:
+            - Results are memoized since the same sources/destinations recur
+              throughout large ACLs
+            - Each conversion is a table lookup, so entries are converted as
+              they are parsed rather than batched into a second pass
+        """
+        prefixlen = _WILDCARD_TO_PREFIX.get(wildcard)
+        if prefixlen is None:
+            logger.debug("Wildcard %s is not a contiguous mask, keeping %s %s", wildcard, ip, wildcard)
+            return f"{ip} {wildcard}"
+        try:
+            ipaddress.IPv4Address(ip)
+        except ipaddress.AddressValueError:
+            logger.warning(f"Could not convert {ip} {wildcard} to CIDR: invalid address")
+            return f"{ip} {wildcard}"
+        return f"{ip}/{prefixlen}"
+
+    def _parse_acl_address(self, parts: List[str], idx: int) -> Tuple[str, int]:
+        """
+        Parse an ACL source or destination address starting at parts[idx].
+
+        Args:
+            parts (List[str]): Tokens of the access-list line
+            idx (int): Index of the first address token
+
+        Returns:
+            Tuple[str, int]: The address ('any', '<ip>/32', CIDR or the raw token)
+                             and the index of the token following it
+        """
+        token = parts[idx]
+        if token == 'host':
+            return f"{parts[idx + 1]}/32", idx + 2
+        if token == 'any':
+            return 'any', idx + 1
+        if idx + 1 < len(parts):
+            # Nearly every mask is a valid wildcard, found by a dict lookup
+            # before falling back to the dotted-quad regex
+            wildcard = parts[idx + 1]
+            if wildcard in _WILDCARD_TO_PREFIX or _IPV4_RE.match(wildcard):
+                return self._convert_wildcard_to_cidr(token, wildcard), idx + 2
+        return token, idx + 1
+
     def _parse_acls(self) -> None:
         """Parse access-list configurations"""
         logger.info("START - Parsing access-list configurations")
@@ -287,132 +861,115 @@ class CiscoACLParser(CiscoConfigParser):
 
         self.acls = {}  # Reset ACLs dictionary
         local_hostname = self.get_hostname()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)  # Skip building per-entry debug text otherwise
 
         try:
-            # First find all unique ACL numbers/names
-            acl_ids = set()
+            # Bucket every access-list line by its ACL number/name in a single pass.
+            # A plain line scan: a MULTILINE '^\s*access-list' regex over the whole
+            # config cannot use the engine's literal-prefix search and is slower
+            acl_buckets = defaultdict(list)
             logger.debug("Scanning config for access-lists...")
-            for line in self.running_config.splitlines():
+            for line in self._config_lines:
                 line = line.strip()
-                if line.startswith('access-list'):
-                    parts = line.split()
+                if line.startswith('access-list '):
+                    parts = line.split(None, 2)
                     if len(parts) >= 2:
-                        acl_ids.add(parts[1])
+                        acl_buckets[parts[1]].append(line)
 
             # Log all found ACLs before starting processing
-            logger.debug(f"Found these ACLs in config: {', '.join(sorted(acl_ids))}")
+            acl_ids = sorted(acl_buckets, key=_acl_sort_key)
+            if debug_enabled:
+                logger.debug("Found these ACLs in config: %s", ', '.join(acl_ids))
 
             # Now process each ACL
-            for acl_id in sorted(acl_ids):
-                logger.debug(f"Processing access-list {acl_id}")
+            parse_address = self._parse_acl_address  # Bound once for the per-line loop
+            for acl_id in acl_ids:
+                logger.debug("Processing access-list %s", acl_id)
                 current_remarks = []
+                entries = []
                 line_number = 0  # Reset line number for each ACL
-
-                # Find all lines for this ACL
-                acl_lines = [line.strip() for line in self.running_config.splitlines()
-                             if line.strip().startswith(f'access-list {acl_id}')]
+                acl_lines = acl_buckets[acl_id]
 
                 # Process each line for this ACL
                 for line in acl_lines:
                     parts = line.split()
 
                     # Handle remarks
-                    if parts[2] == 'remark':
+                    action = parts[2]
+                    if action == 'remark':
                         remark = ' '.join(parts[3:])
                         current_remarks.append(remark)
-                        logger.debug(f"Found Remark in access-list {acl_id} - {remark}")
+                        if debug_enabled:
+                            logger.debug("Found Remark in access-list %s - %s", acl_id, remark)
                         continue
 
                     # Increment line number for non-remark entries
                     line_number += 1
-                    logger.debug(f"Processing line {line_number} of access-list {acl_id} - {line}")
+                    if debug_enabled:
+                        logger.debug("Processing line %s of access-list %s - %s", line_number, acl_id, line)
 
-                    # Create entry with default values
-                    entry = {
-                        "Host": local_hostname,  # Add hostname as first column
-                        "Number": acl_id,        # Move ACL number before Line
-                        "Line": line_number,     # Line number now comes after ACL number
-                        "Action": parts[2],
-                        "Protocol": parts[3] if len(parts) > 3 else '',
-                        "Src-IP": '',
-                        "Src-Protocol": '',
-                        "Dst-IP": '',
-                        "Dst-Protocol": '',
-                        "Remark": ' | '.join(current_remarks)
-                    }
+                    n_parts = len(parts)
+                    protocol = parts[3] if n_parts > 3 else ''
+                    src_ip = dst_ip = src_protocol = dst_protocol = ''
 
                     # Handle special case of "permit any" or "deny any"
-                    if len(parts) == 4 and parts[3] == 'any':
-                        entry['Src-IP'] = 'any'
-                        entry['Dst-IP'] = 'any'
-                        if acl_id not in self.acls:
-                            self.acls[acl_id] = []
-                        self.acls[acl_id].append(entry)
-                        continue
-
-                    # Parse source
-                    idx = 4
-                    if idx < len(parts):
-                        if parts[idx] == 'host':
-                            entry['Src-IP'] = f"{parts[idx + 1]}/32"
-                            idx += 2
-                        elif parts[idx] == 'any':
-                            entry['Src-IP'] = 'any'
-                            idx += 1
-                        else:
-                            if idx + 1 < len(parts) and re.match(r'\d+\.\d+\.\d+\.\d+', parts[idx + 1]):
-                                entry['Src-IP'] = self._convert_wildcard_to_cidr(parts[idx], parts[idx + 1])
+                    if n_parts == 4 and protocol == 'any':
+                        src_ip = dst_ip = 'any'
+                    else:
+                        # Parse source and destination addresses
+                        idx = 4
+                        if idx < n_parts:
+                            src_ip, idx = parse_address(parts, idx)
+                        if idx < n_parts:
+                            dst_ip, idx = parse_address(parts, idx)
+
+                        # Parse remaining protocol information
+                        has_ports = protocol in _ACL_PORT_PROTOCOLS
+                        while idx < n_parts:
+                            keyword = parts[idx]
+                            if keyword in _ACL_PORT_OPERATORS:
+                                protocol_value = parts[idx + 1]
+                                if keyword != 'eq':
+                                    protocol_value = f"{keyword} {protocol_value}"
+
+                                if has_ports and not src_protocol:
+                                    src_protocol = protocol_value
+                                else:
+                                    dst_protocol = protocol_value
                                 idx += 2
-                            else:
-                                entry['Src-IP'] = parts[idx]
+                            elif keyword == 'established':
+                                dst_protocol = 'established'
                                 idx += 1
-
-                    # Parse destination
-                    if idx < len(parts):
-                        if parts[idx] == 'host':
-                            entry['Dst-IP'] = f"{parts[idx + 1]}/32"
-                            idx += 2
-                        elif parts[idx] == 'any':
-                            entry['Dst-IP'] = 'any'
-                            idx += 1
-                        else:
-                            if idx + 1 < len(parts) and re.match(r'\d+\.\d+\.\d+\.\d+', parts[idx + 1]):
-                                entry['Dst-IP'] = self._convert_wildcard_to_cidr(parts[idx], parts[idx + 1])
-                                idx += 2
                             else:
-                                entry['Dst-IP'] = parts[idx]
                                 idx += 1
 
-                    # Parse remaining protocol information
-                    while idx < len(parts):
-                        if parts[idx] in ['eq', 'gt', 'lt', 'neq']:
-                            protocol_value = parts[idx + 1]
-                            if parts[idx] != 'eq':
-                                protocol_value = f"{parts[idx]} {protocol_value}"
-
-                            if not entry['Src-Protocol'] and entry['Protocol'] in ['tcp', 'udp']:
-                                entry['Src-Protocol'] = protocol_value
-                            else:
-                                entry['Dst-Protocol'] = protocol_value
-                            idx += 2
-                        elif parts[idx] == 'established':
-                            entry['Dst-Protocol'] = 'established'
-                            idx += 1
-                        else:
-                            idx += 1
+                    entry = {
+                        "Host": local_hostname,  # Add hostname as first column
+                        "Number": acl_id,        # Move ACL number before Line
+                        "Line": line_number,     # Line number now comes after ACL number
+                        "Action": action,
+                        "Protocol": protocol,
+                        "Src-IP": src_ip,
+                        "Src-Protocol": src_protocol,
+                        "Dst-IP": dst_ip,
+                        "Dst-Protocol": dst_protocol,
+                        "Remark": ' | '.join(current_remarks)
+                    }
 
-                    logger.debug(f"Parsed line {line_number} of access-list {acl_id} - " +
-                                 f"Line: {entry['Line']}, Number: {entry['Number']}, " +
-                                 f"Action: {entry['Action']}, Protocol: {entry['Protocol']}, " +
-                                 f"Src-IP: {entry['Src-IP']}, Src-Protocol: {entry['Src-Protocol']}, " +
-                                 f"Dst-IP: {entry['Dst-IP']}, Dst-Protocol: {entry['Dst-Protocol']}, " +
-                                 f"Remark: {entry['Remark']}")
+                    if debug_enabled:
+                        logger.debug(f"Parsed line {line_number} of access-list {acl_id} - " +
+                                     f"Line: {entry['Line']}, Number: {entry['Number']}, " +
+                                     f"Action: {entry['Action']}, Protocol: {entry['Protocol']}, " +
+                                     f"Src-IP: {entry['Src-IP']}, Src-Protocol: {entry['Src-Protocol']}, " +
+                                     f"Dst-IP: {entry['Dst-IP']}, Dst-Protocol: {entry['Dst-Protocol']}, " +
+                                     f"Remark: {entry['Remark']}")
 
-                    if acl_id not in self.acls:
-                        self.acls[acl_id] = []
-                    self.acls[acl_id].append(entry)
+                    entries.append(entry)
 
-                logger.debug(f"Completed processing access-list {acl_id}")
+                # ACLs made up only of remarks produce no entries
+                if entries:
+                    self.acls[acl_id] = entries
+                logger.debug("Completed processing access-list %s", acl_id)
 
             logger.info("END - Parsing access-list configurations")
 
@@ -542,40 +1099,9 @@ class CiscoInterfaceParser(CiscoConfigParser):
             - Case-sensitive replacement
             - Handles both IOS and NXOS naming conventions
             - Preserves interface numbers and subinterfaces
+            - Results are memoized per raw name by the module-level helper
         """
-        # Strip any leading/trailing whitespace
-        if_name = if_name.strip()
-
-        # Handle Ethernet interfaces
-        if if_name.lower().startswith(('eth', 'ethernet')):
-            # Extract the interface number
-            match = re.search(r'(?:eth(?:ernet)?)\s*(\d+/\d+(?:/\d+)?)', if_name, re.IGNORECASE)
-            if match:
-                return f"Ethernet{match.group(1)}"
-
-        # Handle Port-channel interfaces
-        elif if_name.lower().startswith(('po', 'port-channel')):
-            # Extract the port-channel number
-            match = re.search(r'(?:po(?:rt-channel)?)\s*(\d+)', if_name, re.IGNORECASE)
-            if match:
-                return f"port-channel{match.group(1)}"
-
-        # Handle VLAN interfaces
-        elif if_name.lower().startswith('vlan'):
-            # Extract the VLAN number
-            match = re.search(r'vlan\s*(\d+)', if_name, re.IGNORECASE)
-            if match:
-                return f"Vlan{match.group(1)}"
-
-        # Handle mgmt interfaces
-        elif if_name.lower().startswith(('mgmt', 'management')):
-            # Extract the management interface number
-            match = re.search(r'(?:mgmt(?:mt)?)\s*(\d+/\d+)', if_name, re.IGNORECASE)
-            if match:
-                return f"mgmt{match.group(1)}"
-
-        # Return original name if no normalization needed
-        return if_name
+        return _normalize_interface(if_name)
 
     def _get_truncated_interface_name(self, if_name: str) -> str:
         """Convert full interface name to truncated version for trunk matching."""
@@ -646,47 +1172,8 @@ class CiscoInterfaceParser(CiscoConfigParser):
         header = lines[0]  # Use only the first header line
         logger.debug(f"Using header line: {header}")
 
-        # Define column names and their identifying text for each section type
-        if section_type == 'ethernet':
-            # Define the column headers we're looking for
-            columns = {}
-
-            # Find Ethernet column (starts at position 0)
-            columns['interface'] = (0, 13)  # Ethernet takes up about 13 chars
-            columns['vlan'] = (13, 21)  # VLAN takes up about 8 chars
-            columns['type'] = (21, 26)  # Type takes up about 5 chars
-            columns['mode'] = (26, 33)  # Mode takes up about 7 chars
-            columns['status'] = (33, 41)  # Status takes up about 8 chars
-            columns['reason'] = (41, 65)  # Reason takes up about 24 chars
-            columns['speed'] = (65, 75)  # Speed takes up about 10 chars
-            columns['port_ch'] = (75, 80)  # Port Ch # takes the rest
-
-        elif section_type == 'portchannel':
-            columns = {}
-            columns['interface'] = (0, 13)
-            columns['vlan'] = (13, 21)
-            columns['type'] = (21, 26)
-            columns['mode'] = (26, 33)
-            columns['status'] = (33, 41)
-            columns['reason'] = (41, 65)
-            columns['speed'] = (65, 73)
-            columns['port_ch'] = (73, 80)  # Protocol field
-
-        elif section_type == 'vlan':
-            columns = {}
-            columns['interface'] = (0, 10)
-            columns['vlan'] = (10, 45)  # Secondary VLAN(Type) field
-            columns['status'] = (45, 53)
-            columns['reason'] = (53, 80)
-
-        elif section_type == 'mgmt':
-            columns = {}
-            columns['interface'] = (0, 7)
-            columns['vrf'] = (7, 19)
-            columns['status'] = (19, 28)
-            columns['ip'] = (28, 65)
-            columns['speed'] = (65, 73)
-            columns['mtu'] = (73, 80)
+        # Column layouts are fixed per section type
+        columns = _NEXUS_BRIEF_COLUMNS.get(section_type, {})
 
         logger.debug(f"Mapped columns: {columns}")
         return columns
@@ -724,22 +1211,21 @@ class CiscoInterfaceParser(CiscoConfigParser):
         """
         data = {}
 
-        # Ensure line is at least as long as the last column position
-        max_pos = max(end for start, end in columns.values())
-        padded_line = line.ljust(max_pos)
+        # Unpack every column in one call; the line is padded to the full
+        # record width so short or truncated lines yield empty values
+        layout, fields = _column_layout(tuple(columns.items()))
+        raw_values = layout.unpack_from(line.encode('ascii', errors='replace').ljust(layout.size))
 
-        # Extract each field using column positions
-        for field, (start, end) in columns.items():
-            value = padded_line[start:end].strip()
+        for field, raw_value in zip(fields, raw_values):
+            value = raw_value.decode('ascii').strip()
 
             # Special handling for port_ch field - extract only numerical value
-            if field == 'port_ch':
+            if field == 'port_ch' and not value.isdecimal():
                 # Find any number in the value
-                match = re.search(r'\d+', value)
+                match = _DIGITS_RE.search(value)
                 value = match.group() if match else ''
 
             data[field] = value
-            logger.debug(f"Extracted {field}: '{value}' from positions {start}:{end}")
 
         return data
 
@@ -751,15 +1237,15 @@ class CiscoInterfaceParser(CiscoConfigParser):
             return
 
         try:
-            parse = CiscoConfParse(self.running_config.splitlines())
-            interface_objs = parse.find_objects(r"^interface")
+            interface_blocks = list(_iter_interface_blocks(self._config_lines))
 
-            logger.debug(f"Found {len(interface_objs)} interfaces in running-config")
+            logger.debug("Found %s interfaces in running-config", len(interface_blocks))
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)  # Skip per-child debug calls otherwise
 
-            for interface in interface_objs:
-                interface_name = interface.text.split("interface ")[1]
+            for interface_text, children in interface_blocks:
+                interface_name = interface_text.split("interface ")[1]
                 normalized_name = self._normalize_interface_name(interface_name)
-                logger.debug(f"\nParsing interface configuration for: {interface_name} (normalized: {normalized_name})")
+                logger.debug("\nParsing interface configuration for: %s (normalized: %s)", interface_name, normalized_name)
 
                 # Determine type early
                 interface_type = self._determine_type(normalized_name)
@@ -767,134 +1253,89 @@ class CiscoInterfaceParser(CiscoConfigParser):
                 # Extract port-channel number if this is a port-channel interface
                 port_channel_num = ""
                 if interface_type == "port-channel":
-                    match = re.search(r'port-channel(\d+)', normalized_name, re.IGNORECASE)
+                    match = _PO_NAME_NUMBER_RE.search(normalized_name)
                     if match:
                         port_channel_num = match.group(1)
-                        logger.debug(f"    Found port-channel number: {port_channel_num}")
+                        logger.debug("    Found port-channel number: %s", port_channel_num)
 
                 # Initialize interface dictionary using normalized name
-                self.interfaces[normalized_name] = {
-                    "Host": self.get_hostname(),  # Add hostname as first column
-                    "if_name": normalized_name,
-                    "type": interface_type,
-                    "mode": "access",  # Default mode is access
-                    "vlan": "",
-                    "allowed_trunks": "", # Initialize allowed_trunks
-                    "admin_state": "",
-                    "protocol_status": "",
-                    "speed": "",
-                    "duplex": "",
-                    "media_type": "",
-                    "link_type": "",
-                    "flow_control_in": "",
-                    "flow_control_out": "",
-                    "port_channel": port_channel_num,  # Set port-channel number if found
-                    "description": "",
-                    "ip_cidr": "",
-                    "hardware_type": "",
-                    "mac_address": "",
-                    "bia_address": "",  # Burned In Address
-                    "mtu": "",
-                    "bandwidth": "",
-                    "delay": "",
-                    "reliability": "",
-                    "txload": "",
-                    "rxload": "",
-                    "encapsulation": "",
-                    "arp_timeout": "",
-                    "last_input": "",
-                    "last_output": "",
-                    "last_output_hang": "",
-                    "queue_strategy": "",
-                    "input_rate (bps)": "",
-                    "output_rate (bps)": "",
-                    "input_packets": "",
-                    "input_bytes": "",
-                    "output_packets": "",
-                    "output_bytes": "",
-                    "input_errors": "",
-                    "output_errors": "",
-                    "crc_errors": "",
-                    "frame_errors": "",
-                    "overrun_errors": "",
-                    "unknown_protocols": "",
-                    "broadcasts_received": "",
-                    "multicasts_received": "",
-                    "input_drops": "",
-                    "output_drops": "",
-                    "interface_resets": "",
-                    "carrier_transitions": ""
-                }
+                interface = dict(_INTERFACE_TEMPLATE)
+                interface["Host"] = self.get_hostname()
+                interface["if_name"] = normalized_name
+                interface["type"] = interface_type
+                interface["port_channel"] = port_channel_num  # Set port-channel number if found
+                self.interfaces[normalized_name] = interface
 
                 # If it's a Vlan or Loopback interface, force mode to routed immediately
                 if interface_type in ["vlan", "loopback"]:
-                    self.interfaces[normalized_name]["mode"] = "routed"
+                    interface["mode"] = "routed"
                     # Extract and set VLAN number for VLAN interfaces
                     if interface_type == "vlan":
-                        vlan_match = re.search(r'vlan(\d+)', normalized_name, re.IGNORECASE)
+                        vlan_match = _VLAN_NAME_NUMBER_RE.search(normalized_name)
                         if vlan_match:
-                            self.interfaces[normalized_name]["vlan"] = vlan_match.group(1)
-                    logger.debug(f"    Interface type is {interface_type}, setting mode to routed")
+                            interface["vlan"] = vlan_match.group(1)
+                    logger.debug("    Interface type is %s, setting mode to routed", interface_type)
 
                 # Parse interface details
                 ip_address = ""
                 ip_mask = ""
-                for child in interface.children:
-                    child_text = child.text.strip()
-                    logger.debug(f"  Processing child config: {child_text}")
+                for child in children:
+                    child_text = child.strip()
+                    if debug_enabled:
+                        logger.debug("  Processing child config: %s", child_text)
+                    if not child_text.startswith(_INTERFACE_CHILD_PREFIXES):
+                        continue
                     if child_text.startswith("description"):
-                        self.interfaces[normalized_name]["description"] = child_text.split("description ", 1)[1]
-                        logger.debug(f"    Found description: {self.interfaces[normalized_name]['description']}")
+                        interface["description"] = child_text.split("description ", 1)[1]
+                        logger.debug("    Found description: %s", interface['description'])
                     elif child_text.startswith("switchport access vlan"):
-                        self.interfaces[normalized_name]["vlan"] = child_text.split("switchport access vlan ", 1)[1]
-                        self.interfaces[normalized_name]["mode"] = "access"
-                        logger.debug(f"    Found access VLAN: {self.interfaces[normalized_name]['vlan']}")
+                        interface["vlan"] = child_text.split("switchport access vlan ", 1)[1]
+                        interface["mode"] = "access"
+                        logger.debug("    Found access VLAN: %s", interface['vlan'])
                     elif child_text.startswith("switchport trunk native vlan"):
-                        self.interfaces[normalized_name]["vlan"] = child_text.split("switchport trunk native vlan ", 1)[1]
-                        self.interfaces[normalized_name]["mode"] = "trunk"
-                        logger.debug(f"    Found trunk native VLAN: {self.interfaces[normalized_name]['vlan']}")
+                        interface["vlan"] = child_text.split("switchport trunk native vlan ", 1)[1]
+                        interface["mode"] = "trunk"
+                        logger.debug("    Found trunk native VLAN: %s", interface['vlan'])
                     elif child_text == "switchport mode trunk":
-                        self.interfaces[normalized_name]["mode"] = "trunk"
-                        logger.debug(f"    Found trunk mode")
+                        interface["mode"] = "trunk"
+                        logger.debug("    Found trunk mode")
                     elif child_text.startswith("switchport trunk allowed vlan"):
                         allowed_vlans = child_text.split("switchport trunk allowed vlan ", 1)[1]
                         # Handle keywords like 'add', 'remove', 'except' - for now, just take the value
                         # More sophisticated parsing might be needed depending on requirements
-                        self.interfaces[normalized_name]["allowed_trunks"] = allowed_vlans.split()[0] # Take first part for simplicity
-                        logger.debug(f"    Found allowed trunk VLANs: {self.interfaces[normalized_name]['allowed_trunks']}")
+                        interface["allowed_trunks"] = allowed_vlans.split()[0] # Take first part for simplicity
+                        logger.debug("    Found allowed trunk VLANs: %s", interface['allowed_trunks'])
                     elif child_text.startswith("channel-group"):
                         port_channel = child_text.split("channel-group ", 1)[1].split(" ")[0]
-                        self.interfaces[normalized_name]["port_channel"] = port_channel
-                        logger.debug(f"    Found port-channel: {port_channel}")
+                        interface["port_channel"] = port_channel
+                        logger.debug("    Found port-channel: %s", port_channel)
                     elif child_text == "no switchport":
-                        self.interfaces[normalized_name]["mode"] = "routed"
-                        logger.debug(f"    Found 'no switchport', setting mode to routed")
+                        interface["mode"] = "routed"
+                        logger.debug("    Found 'no switchport', setting mode to routed")
                     elif child_text.startswith("ip address"):
                         parts = child_text.split()
                         if len(parts) >= 4:
                             ip_address = parts[2]
                             ip_mask = parts[3]
-                            logger.debug(f"    Found IP address: {ip_address}/{ip_mask}")
+                            logger.debug("    Found IP address: %s/%s", ip_address, ip_mask)
                         else:
                             logger.warning(f"    Could not parse IP address line: {child_text}")
 
                 # Post-processing for the interface
+                mode = interface["mode"]
                 # Assign default VLAN 1 if mode is access and no VLAN was explicitly set
-                if self.interfaces[normalized_name]["mode"] == "access" and not self.interfaces[normalized_name]["vlan"]:
-                    self.interfaces[normalized_name]["vlan"] = "1"
-                    logger.debug(f"    Mode is access and no VLAN found, defaulting VLAN to 1")
+                if mode == "access" and not interface["vlan"]:
+                    interface["vlan"] = "1"
+                    logger.debug("    Mode is access and no VLAN found, defaulting VLAN to 1")
                 # If mode is trunk and no specific allowed VLANs were found, default to 1-4094
-                elif self.interfaces[normalized_name]["mode"] == "trunk" and not self.interfaces[normalized_name]["allowed_trunks"]:
-                    self.interfaces[normalized_name]["allowed_trunks"] = "1-4094"
-                    logger.debug(f"    Mode is trunk and no allowed VLANs found, defaulting to 1-4094")
-
-                # Calculate CIDR if mode is routed and IP/mask were found
-                if self.interfaces[normalized_name]["mode"] == "routed" and ip_address and ip_mask:
-                    self.interfaces[normalized_name]["ip_cidr"] = ip_mask_to_cidr(ip_address, ip_mask)
-                    logger.debug(f"    Mode is routed, calculated CIDR: {self.interfaces[normalized_name]['ip_cidr']}")
-                # If mode is not routed, ensure ip_cidr is empty
-                elif self.interfaces[normalized_name]["mode"] != "routed":
-                    self.interfaces[normalized_name]["ip_cidr"] = ""
+                elif mode == "trunk" and not interface["allowed_trunks"]:
+                    interface["allowed_trunks"] = "1-4094"
+                    logger.debug("    Mode is trunk and no allowed VLANs found, defaulting to 1-4094")
+                # Calculate CIDR if mode is routed and IP/mask were found; otherwise
+                # ip_cidr keeps the template's empty default
+                elif mode == "routed" and ip_address and ip_mask:
+                    interface["ip_cidr"] = ip_mask_to_cidr(ip_address, ip_mask)
+                    logger.debug("    Mode is routed, calculated CIDR: %s", interface['ip_cidr'])
 
             logger.debug("\nCompleted initial interface parsing from running-config")
             self._update_interface_status()
@@ -959,6 +1400,7 @@ class CiscoInterfaceParser(CiscoConfigParser):
         try:
             if self.device_type == "Nexus Switch":
                 logger.debug("\nProcessing Nexus interface status:")
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)  # Skip per-line debug calls otherwise
                 if hasattr(self, 'show_interfaces_brief'):
                     brief_lines = self.show_interfaces_brief.splitlines()
                     current_section = None
@@ -977,20 +1419,17 @@ class CiscoInterfaceParser(CiscoConfigParser):
                             in_section = not in_section  # Toggle section state
                             continue
 
-                        # If we're at the start of a section, check for headers
-                        if in_section:
-                            if 'Ethernet' in line and 'VLAN' in line:
-                                current_section = 'ethernet'
-                                current_columns = self._get_column_positions(line, 'ethernet')
-                                logger.debug("Entering ethernet section")
+                        # If we're at the start of a section, check for headers.
+                        # Data lines never contain 'VLAN', so test that first
+                        if in_section and 'VLAN' in line:
+                            header = next((section for keyword, section in _NEXUS_BRIEF_SECTIONS
+                                           if keyword in line), None)
+                            if header is not None:
+                                current_section = header
+                                current_columns = self._get_column_positions(line, header)
+                                logger.debug("Entering %s section", header)
                                 in_section = False  # Reset to handle data lines
                                 continue
-                            elif 'Port-channel' in line and 'VLAN' in line:
-                                current_section = 'portchannel'
-                                current_columns = self._get_column_positions(line, 'portchannel')
-                                logger.debug("Entering port-channel section")
-                                in_section = False
-                                continue
 
                         # Skip the interface/header continuation line
                         if 'Interface' in line or 'Ch #' in line:
@@ -999,160 +1438,157 @@ class CiscoInterfaceParser(CiscoConfigParser):
                         # Process data lines
                         if current_section and current_columns:
                             parsed_data = self._parse_interface_line(line, current_columns)
-                            logger.debug(f"Parsed line: {line}")
-                            logger.debug(f"Parsed data: {parsed_data}")
-
                             if_name = self._normalize_interface_name(parsed_data['interface'])
-                            logger.debug(f"Normalized interface name: {if_name}")
+                            if debug_enabled:
+                                logger.debug("Parsed line: %s", line)
+                                logger.debug("Parsed data: %s", parsed_data)
+                                logger.debug("Normalized interface name: %s", if_name)
 
-                            if if_name in self.interfaces:
-                                logger.debug(f"Updating interface {if_name}")
-                                update_data = {
-                                    "protocol_status": parsed_data['status']
-                                }
+                            interface = self.interfaces.get(if_name)
+                            if interface is not None:
+                                if debug_enabled:
+                                    logger.debug("Updating interface %s", if_name)
+                                interface["protocol_status"] = parsed_data['status']
 
                                 # Add fields based on section type
-                                if current_section in ['ethernet', 'portchannel']:
-                                    update_data.update({
-                                        "vlan": parsed_data['vlan'],
-                                        "speed": parsed_data['speed'].split('(')[0].strip(),  # Remove (D) suffix
-                                    })
+                                if current_section in ('ethernet', 'portchannel'):
+                                    interface["vlan"] = parsed_data['vlan']
+                                    interface["speed"] = parsed_data['speed'].partition('(')[0].strip()  # Remove (D) suffix
                                     if 'port_ch' in parsed_data:
                                         if parsed_data['port_ch'] != '--':
-                                            update_data["port_channel"] = parsed_data['port_ch']
-
-                                self.interfaces[if_name].update(update_data)
+                                            interface["port_channel"] = parsed_data['port_ch']
                             else:
-                                logger.debug(f"Interface {if_name} not found in running-config")
+                                logger.debug("Interface %s not found in running-config", if_name)
 
             # Parse detailed interface information from show interfaces
             if hasattr(self, 'show_interfaces'):
-                interface_sections = re.split(r'\n(?=\S+? is)', self.show_interfaces)
-                for section in interface_sections:
-                    if not section.strip():
-                        continue
-
-                    # Extract interface name and basic status
-                    name_match = re.match(r'(\S+?) is (.*?), line protocol is (\S+)', section)
-                    if not name_match:
-                        continue
-
+                show_interfaces = self.show_interfaces
+                for name_match, start, end in _iter_interface_status(show_interfaces):
                     if_name = self._normalize_interface_name(name_match.group(1))
-                    if if_name not in self.interfaces:
+                    interface = self.interfaces.get(if_name)
+                    if interface is None:
                         continue
+                    section = show_interfaces[start:end]
 
                     # Update admin and protocol status
-                    self.interfaces[if_name]["admin_state"] = name_match.group(2)
-                    self.interfaces[if_name]["protocol_status"] = name_match.group(3)
+                    interface["admin_state"] = name_match.group(2)
+                    interface["protocol_status"] = name_match.group(3)
 
                     # Extract hardware type and MAC addresses
-                    hw_match = re.search(r'Hardware is (.*?), address is (\S+)(?:\s+\(bia (\S+)\))?', section)
+                    hw_match = _IF_HARDWARE_RE.search(section)
                     if hw_match:
-                        self.interfaces[if_name]["hardware_type"] = hw_match.group(1)
-                        self.interfaces[if_name]["mac_address"] = hw_match.group(2)
+                        interface["hardware_type"] = hw_match.group(1)
+                        interface["mac_address"] = hw_match.group(2)
                         if hw_match.group(3):
-                            self.interfaces[if_name]["bia_address"] = hw_match.group(3)
+                            interface["bia_address"] = hw_match.group(3)
 
                     # Extract duplex, speed, link type and media type
-                    link_info_match = re.search(r'((?:Auto|Full|Half)-duplex), (\d+(?:\.\d+)?[MG]b/s)(?:, link type is ([\w-]+))?,?\s*(?:media type is ((?:[\w-]+(?:/[\w-]+)*)+(?:\s+[\w-]+)*(?:\s+SFP)?))(?:\s*$|\n)', section)
+                    link_info_match = _IF_LINK_INFO_RE.search(section)
                     if link_info_match:
-                        self.interfaces[if_name]["duplex"] = link_info_match.group(1)
-                        self.interfaces[if_name]["speed"] = link_info_match.group(2)
+                        interface["duplex"] = link_info_match.group(1)
+                        interface["speed"] = link_info_match.group(2)
                         if link_info_match.group(3):
-                            self.interfaces[if_name]["link_type"] = link_info_match.group(3)
+                            interface["link_type"] = link_info_match.group(3)
                         if link_info_match.group(4):
-                            self.interfaces[if_name]["media_type"] = link_info_match.group(4).strip()
+                            interface["media_type"] = link_info_match.group(4).strip()
 
                     # Extract flow control information
-                    flow_control_match = re.search(r'input flow-control is (\w+), output flow-control is (\w+)', section)
+                    flow_control_match = _IF_FLOW_CONTROL_RE.search(section)
                     if flow_control_match:
-                        self.interfaces[if_name]["flow_control_in"] = flow_control_match.group(1)
-                        self.interfaces[if_name]["flow_control_out"] = flow_control_match.group(2)
+                        interface["flow_control_in"] = flow_control_match.group(1)
+                        interface["flow_control_out"] = flow_control_match.group(2)
 
                     # Extract MTU, BW, DLY
-                    mtu_match = re.search(r'MTU (\d+) bytes, BW (\d+) Kbit/sec, DLY (\d+) usec', section)
+                    mtu_match = _IF_MTU_RE.search(section)
                     if mtu_match:
-                        self.interfaces[if_name]["mtu"] = mtu_match.group(1)
-                        self.interfaces[if_name]["bandwidth"] = mtu_match.group(2)
-                        self.interfaces[if_name]["delay"] = mtu_match.group(3)
+                        interface["mtu"] = mtu_match.group(1)
+                        interface["bandwidth"] = mtu_match.group(2)
+                        interface["delay"] = mtu_match.group(3)
 
                     # Extract reliability and load
-                    load_match = re.search(r'reliability (\d+)/\d+, txload (\d+)/\d+, rxload (\d+)/\d+', section)
+                    load_match = _IF_LOAD_RE.search(section)
                     if load_match:
-                        self.interfaces[if_name]["reliability"] = load_match.group(1)
-                        self.interfaces[if_name]["txload"] = load_match.group(2)
-                        self.interfaces[if_name]["rxload"] = load_match.group(3)
+                        interface["reliability"] = load_match.group(1)
+                        interface["txload"] = load_match.group(2)
+                        interface["rxload"] = load_match.group(3)
+
+                    # The counter lines all start with a number; match them in one
+                    # pass and keep the first occurrence of each counter
+                    counters = {}
+                    for counter in _IF_COUNTERS_RE.finditer(section):
+                        kind = counter.lastgroup
+                        preceded_by = _IF_COUNTER_PRECEDED_BY.get(kind)
+                        if preceded_by is None or preceded_by in counters:
+                            counters.setdefault(kind, counter)
 
                     # Extract input/output rates
-                    rate_match = re.search(r'(\d+) minute input rate (\d+) bits/sec.*?(\d+) minute output rate (\d+) bits/sec', section, re.DOTALL)
-                    if rate_match:
-                        self.interfaces[if_name]["input_rate (bps)"] = rate_match.group(2)
-                        self.interfaces[if_name]["output_rate (bps)"] = rate_match.group(4)
+                    if 'input_rate' in counters and 'output_rate' in counters:
+                        interface["input_rate (bps)"] = counters['input_rate']['input_bps']
+                        interface["output_rate (bps)"] = counters['output_rate']['output_bps']
 
                     # Extract packet statistics
-                    packets_match = re.search(r'(\d+) packets input,\s*(\d+) bytes.*?(\d+) packets output,\s*(\d+) bytes', section, re.DOTALL)
-                    if packets_match:
-                        self.interfaces[if_name]["input_packets"] = packets_match.group(1)
-                        self.interfaces[if_name]["input_bytes"] = packets_match.group(2)
-                        self.interfaces[if_name]["output_packets"] = packets_match.group(3)
-                        self.interfaces[if_name]["output_bytes"] = packets_match.group(4)
+                    if 'packets_input' in counters and 'packets_output' in counters:
+                        interface["input_packets"] = counters['packets_input']['count']
+                        interface["input_bytes"] = counters['packets_input']['input_bytes']
+                        interface["output_packets"] = counters['packets_output']['count']
+                        interface["output_bytes"] = counters['packets_output']['output_bytes']
 
                     # Extract error statistics
-                    input_errors_match = re.search(r'(\d+) input errors,\s*(\d+) CRC,\s*(\d+) frame,\s*(\d+) overrun', section)
+                    input_errors_match = counters.get('input_errors')
                     if input_errors_match:
-                        self.interfaces[if_name]["input_errors"] = input_errors_match.group(1)
-                        self.interfaces[if_name]["crc_errors"] = input_errors_match.group(2)
-                        self.interfaces[if_name]["frame_errors"] = input_errors_match.group(3)
-                        self.interfaces[if_name]["overrun_errors"] = input_errors_match.group(4)
+                        interface["input_errors"] = input_errors_match['count']
+                        interface["crc_errors"] = input_errors_match['crc']
+                        interface["frame_errors"] = input_errors_match['frame']
+                        interface["overrun_errors"] = input_errors_match['overrun']
 
                     # Extract output errors
-                    output_errors_match = re.search(r'(\d+) output errors', section)
+                    output_errors_match = counters.get('output_errors')
                     if output_errors_match:
-                        self.interfaces[if_name]["output_errors"] = output_errors_match.group(1)
+                        interface["output_errors"] = output_errors_match['count']
 
                     # Extract broadcast/multicast information
-                    broadcast_match = re.search(r'Received (\d+) broadcasts \((\d+) multicasts\)', section)
+                    broadcast_match = _IF_BROADCAST_RE.search(section)
                     if broadcast_match:
-                        self.interfaces[if_name]["broadcasts_received"] = broadcast_match.group(1)
-                        self.interfaces[if_name]["multicasts_received"] = broadcast_match.group(2)
+                        interface["broadcasts_received"] = broadcast_match.group(1)
+                        interface["multicasts_received"] = broadcast_match.group(2)
 
                     # Extract queue drops
-                    queue_match = re.search(r'Input queue: (\d+)/\d+/(\d+)/\d+ \(size/max/drops/flushes\); Total output drops: (\d+)', section)
+                    queue_match = _IF_QUEUE_DROPS_RE.search(section)
                     if queue_match:
-                        self.interfaces[if_name]["input_drops"] = queue_match.group(2)
-                        self.interfaces[if_name]["output_drops"] = queue_match.group(3)
+                        interface["input_drops"] = queue_match.group(2)
+                        interface["output_drops"] = queue_match.group(3)
 
                     # Extract interface resets and carrier transitions
-                    resets_match = re.search(r'(\d+) interface resets', section)
+                    resets_match = counters.get('interface_resets')
                     if resets_match:
-                        self.interfaces[if_name]["interface_resets"] = resets_match.group(1)
+                        interface["interface_resets"] = resets_match['count']
 
-                    carrier_match = re.search(r'(\d+) lost carrier, (\d+) no carrier', section)
+                    carrier_match = counters.get('lost_carrier')
                     if carrier_match:
-                        total_transitions = int(carrier_match.group(1)) + int(carrier_match.group(2))
-                        self.interfaces[if_name]["carrier_transitions"] = str(total_transitions)
+                        total_transitions = int(carrier_match['count']) + int(carrier_match['no_carrier'])
+                        interface["carrier_transitions"] = str(total_transitions)
 
                     # Extract encapsulation
-                    encap_match = re.search(r'Encapsulation (\w+)', section)
+                    encap_match = _IF_ENCAPSULATION_RE.search(section)
                     if encap_match:
-                        self.interfaces[if_name]["encapsulation"] = encap_match.group(1)
+                        interface["encapsulation"] = encap_match.group(1)
 
                     # Extract ARP timeout
-                    arp_match = re.search(r'ARP Timeout (\d{2}:\d{2}:\d{2})', section)
+                    arp_match = _IF_ARP_TIMEOUT_RE.search(section)
                     if arp_match:
-                        self.interfaces[if_name]["arp_timeout"] = arp_match.group(1)
+                        interface["arp_timeout"] = arp_match.group(1)
 
                     # Extract last input/output times
-                    last_io_match = re.search(r'Last input ([\w\d:]+), output ([\w\d:]+), output hang ([\w\d:]+)', section)
+                    last_io_match = _IF_LAST_IO_RE.search(section)
                     if last_io_match:
-                        self.interfaces[if_name]["last_input"] = last_io_match.group(1)
-                        self.interfaces[if_name]["last_output"] = last_io_match.group(2)
-                        self.interfaces[if_name]["last_output_hang"] = last_io_match.group(3)
+                        interface["last_input"] = last_io_match.group(1)
+                        interface["last_output"] = last_io_match.group(2)
+                        interface["last_output_hang"] = last_io_match.group(3)
 
                     # Extract queueing strategy
-                    queue_match = re.search(r'Queueing strategy: (\w+)', section)
+                    queue_match = _IF_QUEUEING_RE.search(section)
                     if queue_match:
-                        self.interfaces[if_name]["queue_strategy"] = queue_match.group(1)
+                        interface["queue_strategy"] = queue_match.group(1)
 
             logger.info("END - Updating interface status information")
 
@@ -1166,10 +1602,6 @@ class CiscoInterfaceParser(CiscoConfigParser):
         current_section = None
         current_interface = None
 
-        # Initialize patterns
-        interface_pattern = re.compile(r'^(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)')
-        vlan_pattern = re.compile(r'^(\S+)\s+(.+)$')
-
         for line in self.show_interfaces_trunk.splitlines():
             line = line.strip()
             
@@ -1193,7 +1625,7 @@ class CiscoInterfaceParser(CiscoConfigParser):
 
             # Process data based on current section
             if current_section == 'ports':
-                match = interface_pattern.match(line)
+                match = _TRUNK_INTERFACE_RE.match(line)
                 if match:
                     current_interface = match.group(1)
                     trunk_data[current_interface] = {
@@ -1206,7 +1638,7 @@ class CiscoInterfaceParser(CiscoConfigParser):
                         'forwarding_vlans': []
                     }
             elif current_section in ['allowed', 'active', 'forwarding'] and current_interface:
-                match = vlan_pattern.match(line)
+                match = _TRUNK_VLAN_RE.match(line)
                 if match:
                     # Skip the interface name column if present
                     vlan_list = match.group(2) if match.group(1) == current_interface else match.group(1)
@@ -1221,7 +1653,8 @@ class CiscoInterfaceParser(CiscoConfigParser):
                         trunk_data[current_interface]['forwarding_vlans'] = vlans
 
         # Log the final trunk data for debugging
-        logger.debug(f"Parsed trunk data: {json.dumps(trunk_data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):  # Skip serialising the whole table otherwise
+            logger.debug("Parsed trunk data: %s", json.dumps(trunk_data, indent=2))
         self.trunk_data = trunk_data
 
     def _expand_vlan_range(self, vlan_str: str) -> List[int]:
@@ -1255,7 +1688,7 @@ class CiscoInterfaceParser(CiscoConfigParser):
 
         try:
             # Split the output into individual neighbor entries
-            neighbor_entries = re.split(r'\n(?=-{3,}|\s*Device ID:)', self.show_cdp_neighbor_detail)
+            neighbor_entries = _CDP_ENTRY_SPLIT_RE.split(self.show_cdp_neighbor_detail)
             logger.debug(f"Found {len(neighbor_entries)} potential CDP entries")
             logger.debug("First entry preview (first 200 chars):\n" + neighbor_entries[0][:200] + "...")
             if len(neighbor_entries) > 1:
@@ -1274,11 +1707,11 @@ class CiscoInterfaceParser(CiscoConfigParser):
 
         for i, entry in enumerate(neighbor_entries, 1):
             if not entry.strip():
-                logger.debug(f"Skipping empty entry {i}")
+                logger.debug("Skipping empty entry %s", i)
                 continue
 
-            logger.debug(f"\n=== Processing CDP Entry {i} ===")
-            logger.debug(f"Entry content preview:\n{entry[:300]}...")
+            logger.debug("\n=== Processing CDP Entry %s ===", i)
+            logger.debug("Entry content preview:\n%s...", entry[:300])
 
             try:
                 # Initialize data dictionary for this neighbor
@@ -1294,77 +1727,71 @@ class CiscoInterfaceParser(CiscoConfigParser):
                 }
 
                 # Extract Device ID (Remote Hostname)
-                device_id_pattern = r"(?:Device ID:|Device ID\s*:\s*)(.*?)(?:\(|\n|$)"
-                device_id_match = re.search(device_id_pattern, entry, re.IGNORECASE | re.MULTILINE)
+                device_id_match = _CDP_DEVICE_ID_RE.search(entry)
                 if device_id_match:
                     data["Remote Hostname"] = device_id_match.group(1).strip()
-                    logger.debug(f"Found Device ID: '{data['Remote Hostname']}'")
+                    logger.debug("Found Device ID: '%s'", data['Remote Hostname'])
                 else:
-                    logger.debug(f"No Device ID match found. Pattern: {device_id_pattern}")
-                    logger.debug("Entry section:\n" + entry[:200])
+                    logger.debug("No Device ID match found. Pattern: %s", _CDP_DEVICE_ID_RE.pattern)
+                    logger.debug("Entry section:\n%s", entry[:200])
 
                 # Extract Interface and Port ID
-                interface_pattern = r"Interface:\s*([\w\-/\.]+)[,\s]*Port ID \(outgoing port\):\s*(.*?)(?:\n|$)"
-                interface_match = re.search(interface_pattern, entry, re.IGNORECASE | re.MULTILINE)
+                interface_match = _CDP_INTERFACE_RE.search(entry)
                 if interface_match:
                     data["Local Interface"] = self._normalize_interface_name(interface_match.group(1).strip())
                     data["Remote Port"] = interface_match.group(2).strip()
-                    logger.debug(f"Found Interface: '{data['Local Interface']}', Port: '{data['Remote Port']}'")
+                    logger.debug("Found Interface: '%s', Port: '%s'", data['Local Interface'], data['Remote Port'])
                 else:
-                    logger.debug(f"No Interface match found. Pattern: {interface_pattern}")
-                    logger.debug("Entry section:\n" + entry[:200])
+                    logger.debug("No Interface match found. Pattern: %s", _CDP_INTERFACE_RE.pattern)
+                    logger.debug("Entry section:\n%s", entry[:200])
 
                 # Extract Platform
-                platform_pattern = r"Platform:\s*(.*?)(?:,|\n|$)"
-                platform_match = re.search(platform_pattern, entry, re.IGNORECASE | re.MULTILINE)
+                platform_match = _CDP_PLATFORM_RE.search(entry)
                 if platform_match:
                     data["Platform"] = platform_match.group(1).strip()
-                    logger.debug(f"Found Platform: '{data['Platform']}'")
+                    logger.debug("Found Platform: '%s'", data['Platform'])
                 else:
-                    logger.debug(f"No Platform match found. Pattern: {platform_pattern}")
+                    logger.debug("No Platform match found. Pattern: %s", _CDP_PLATFORM_RE.pattern)
 
                 # Extract Capabilities
-                caps_pattern = r"Capabilities:\s*(.*?)(?:\n|$)"
-                caps_match = re.search(caps_pattern, entry, re.IGNORECASE | re.MULTILINE)
+                caps_match = _CDP_CAPABILITIES_RE.search(entry)
                 if caps_match: 
                     caps_text = caps_match.group(1).strip()
                     cap_codes = []
-                    logger.debug(f"Found capabilities text: '{caps_text}'")
+                    logger.debug("Found capabilities text: '%s'", caps_text)
                     for cap in caps_text.split():
                         cap = cap.strip(' ,')
                         if cap in capability_map:
                             cap_codes.append(capability_map[cap])
-                            logger.debug(f"Mapped capability '{cap}' to '{capability_map[cap]}'")
+                            logger.debug("Mapped capability '%s' to '%s'", cap, capability_map[cap])
                         else:
-                            logger.debug(f"No mapping found for capability: '{cap}'")
+                            logger.debug("No mapping found for capability: '%s'", cap)
                     data["Capabilities"] = "".join(sorted(set(cap_codes)))
-                    logger.debug(f"Final capabilities string: '{data['Capabilities']}'")
+                    logger.debug("Final capabilities string: '%s'", data['Capabilities'])
                 else:
-                    logger.debug(f"No Capabilities match found. Pattern: {caps_pattern}")
+                    logger.debug("No Capabilities match found. Pattern: %s", _CDP_CAPABILITIES_RE.pattern)
 
                 # Extract IP Address
-                ip_pattern = r"(?:Management address|IP address|IPv4 address):\s*([\d\.]+)"
-                ip_match = re.search(ip_pattern, entry, re.IGNORECASE | re.MULTILINE)
+                ip_match = _CDP_IP_RE.search(entry)
                 if ip_match:
                     data["Remote IP"] = ip_match.group(1).strip()
-                    logger.debug(f"Found IP: '{data['Remote IP']}'")
+                    logger.debug("Found IP: '%s'", data['Remote IP'])
                 else:
-                    logger.debug(f"No IP match found. Pattern: {ip_pattern}")
+                    logger.debug("No IP match found. Pattern: %s", _CDP_IP_RE.pattern)
 
                 # Extract Software Version
-                version_pattern = r"(?:Software Version|Version|Cisco IOS Software).*?[\r\n]+\s*(.*?)(?:\n\n|\n(?=[A-Z])|advertisement|Configuration|Copyright|\Z)"
-                version_match = re.search(version_pattern, entry, re.DOTALL | re.IGNORECASE)
+                version_match = _CDP_VERSION_RE.search(entry)
                 if version_match:
-                    version = re.sub(r'\s+', ' ', version_match.group(1).strip())
+                    version = _WHITESPACE_RUN_RE.sub(' ', version_match.group(1).strip())
                     data["Remote Version"] = version
-                    logger.debug(f"Found Version: '{version[:100]}...'")
+                    logger.debug("Found Version: '%s...'", version[:100])
                 else:
-                    logger.debug(f"No Version match found. Pattern: {version_pattern}")
+                    logger.debug("No Version match found. Pattern: %s", _CDP_VERSION_RE.pattern)
 
                 # Validate entry
                 if data["Remote Hostname"] and data["Local Interface"]:
                     self.cdp_neighbors.append(data)
-                    logger.debug(f"Successfully added CDP neighbor: {data['Local Interface']} -> {data['Remote Hostname']}")
+                    logger.debug("Successfully added CDP neighbor: %s -> %s", data['Local Interface'], data['Remote Hostname'])
                 else:
                     logger.warning(
                         f"Skipping CDP entry {i} due to missing essential information:\n"
@@ -1374,7 +1801,7 @@ class CiscoInterfaceParser(CiscoConfigParser):
 
             except Exception as e:
                 logger.error(f"Error processing CDP entry {i}: {str(e)}")
-                logger.debug("Problematic entry content:\n" + entry)
+                logger.debug("Problematic entry content:\n%s", entry)
                 continue
 
         logger.debug("\n=== Final CDP Processing Results ===")
@@ -1384,10 +1811,12 @@ class CiscoInterfaceParser(CiscoConfigParser):
             logger.debug("Parsed CDP neighbors:")
             for neighbor in self.cdp_neighbors:
                 logger.debug(
-                    f"  {neighbor['Local Interface']} -> {neighbor['Remote Hostname']}\n"
-                    f"    IP: {neighbor['Remote IP']}\n"
-                    f"    Platform: {neighbor['Platform']}\n"
-                    f"    Capabilities: {neighbor['Capabilities']}"
+                    "  %s -> %s\n"
+                    "    IP: %s\n"
+                    "    Platform: %s\n"
+                    "    Capabilities: %s",
+                    neighbor['Local Interface'], neighbor['Remote Hostname'],
+                    neighbor['Remote IP'], neighbor['Platform'], neighbor['Capabilities']
                 )
         else:
             logger.warning("No CDP neighbors were successfully parsed!")
@@ -1425,16 +1854,10 @@ def _determine_device_type(content: str) -> str:
     version_match = None
 
     # Try IOS-style section marker with flexible whitespace
-    ios_version = re.search(
-        r'-{18,}\s*show\s+version\s*-+\n(.*?)(?=\n-{18,}|\Z)',
-        content, re.DOTALL | re.MULTILINE
-    )
+    ios_version = _IOS_VERSION_RE.search(content)
 
     # Try Nexus-style command output with flexible whitespace
-    nexus_version = re.search(
-        r'(?:^|\n)(?:`show\s+version\s*`|show\s+version\s*\n)(.*?)(?=\n`show|\nshow\s|$)',
-        content, re.DOTALL
-    )
+    nexus_version = _NEXUS_VERSION_RE.search(content)
 
     version_text = ""
     if ios_version:
@@ -1445,17 +1868,9 @@ def _determine_device_type(content: str) -> str:
     logger.debug("Version text found:")
     logger.debug(version_text[:200] + "...")  # Show first 200 chars
 
-    # Determine device type from version text - case insensitive matching
-    if re.search(r'NX-OS|Nexus', version_text, re.IGNORECASE):
-        device_type = "Nexus Switch"
-    elif re.search(r'IOS-XE.*Catalyst|Catalyst.*IOS-XE', version_text, re.IGNORECASE):
-        device_type = "Catalyst Switch"
-    elif re.search(r'IOS-XE', version_text, re.IGNORECASE):
-        device_type = "IOS-XE Router"
-    elif re.search(r'IOS Software', version_text, re.IGNORECASE):
-        device_type = "IOS Router"
-    else:
-        device_type = "Unknown Cisco Device"
+    # Determine device type from version text - first matching rule wins
+    device_type = next((name for pattern, name in _DEVICE_TYPE_RULES if pattern.search(version_text)),
+                       "Unknown Cisco Device")
 
     logger.info(f"END - Determining device type: {device_type}")
     return device_type
@@ -1470,16 +1885,33 @@ def sanitize_file_content(filepath: str) -> str:
 
     Returns:
         str: Path to the sanitized file
+
+    Notes:
+        The file is read and rewritten in fixed-size chunks, so memory use
+        does not grow with the size of the show tech.
     """
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
     try:
-        # First try to read with utf-8 to detect non-ASCII characters
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        # Check the raw bytes first; most files need no sanitization
+        with open(filepath, 'rb') as f:
+            while True:
+                chunk = f.read(_SANITIZE_CHUNK_SIZE)
+                if not chunk:
+                    logger.debug(f"File {filepath} is already ASCII-only")
+                    return filepath
+                if not chunk.isascii():
+                    break
 
-        # Check if content needs sanitization
-        if all(ord(c) < 128 for c in content):
-            logger.debug(f"File {filepath} is already ASCII-only")
-            return filepath
+        # Write the sanitized copy alongside the file, replacing each non-ASCII
+        # character with a space. Text mode decodes utf-8 and translates newlines
+        # across chunk boundaries.
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f_in, \
+                open(tmp_path, 'w', encoding='ascii') as f_out:
+            while True:
+                chunk = f_in.read(_SANITIZE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f_out.write(_NON_ASCII_RE.sub(' ', chunk))
 
         # Create originals directory if it doesn't exist
         originals_dir = os.path.join('input', 'originals')
@@ -1491,18 +1923,18 @@ def sanitize_file_content(filepath: str) -> str:
             os.rename(filepath, original_path)
             logger.debug(f"Moved original file to {original_path}")
 
-        # Create sanitized content by replacing non-ASCII characters
-        sanitized_content = ''.join(c if ord(c) < 128 else ' ' for c in content)
-
-        # Write sanitized content back to original filepath
-        with open(filepath, 'w', encoding='ascii') as f:
-            f.write(sanitized_content)
+        # Put the sanitized content at the original filepath
+        os.replace(tmp_path, filepath)
 
         logger.info(f"Created ASCII-only version of {filepath}")
         return filepath
 
     except Exception as e:
         logger.error(f"Failed to sanitize file {filepath}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return filepath
 
 
@@ -1519,31 +1951,47 @@ def find_cisco_files() -> List[Dict]:
     # Create input directory if it doesn't exist
     os.makedirs('input', exist_ok=True)
 
-    # Search through input directory
-    for filename in os.listdir('input'):
-        if filename == 'originals':  # Skip originals directory
-            continue
+    # Search through input directory; DirEntry.is_file() uses the file type
+    # returned with the directory listing instead of a stat per entry
+    filepaths = []
+    with os.scandir('input') as entries:
+        for entry in entries:
+            if entry.name == 'originals':  # Skip originals directory
+                continue
 
-        filepath = os.path.join('input', filename)
-        if not os.path.isfile(filepath):
-            continue
+            if entry.is_file():
+                filepaths.append(entry.path)
+
+    # Section extraction is CPU-bound and independent per file, so larger
+    # listings extract the sections in worker processes and keep them in this
+    # process's section cache; below the threshold starting the pool costs
+    # more than it saves
+    parallel = len(filepaths) >= _PARALLEL_LISTING_MIN_FILES
+    with process_pool() if parallel else nullcontext() as executor:
+        if parallel:
+            pending = [executor.submit(_read_device_info, filepath).result for filepath in filepaths]
+        else:
+            pending = [partial(_read_device_info, filepath) for filepath in filepaths]
 
-        try:
-            # Create temporary parser to get device info
-            parser = CiscoConfigParser(filepath)
-
-            cisco_files.append({
-                'id': file_id,
-                'filename': filepath,
-                'hostname': parser.hostname,
-                'device_type': parser.device_type
-            })
-            file_id += 1
-            logger.debug(f"Added {filepath} as {parser.device_type}")
+        for filepath, read_device_info in zip(filepaths, pending):
+            try:
+                signature, entry = read_device_info()
+                if signature is not None:
+                    _cache_put(CiscoConfigParser._section_cache, signature, entry)
+                hostname, device_type = entry['hostname'], entry['device_type']
+
+                cisco_files.append({
+                    'id': file_id,
+                    'filename': filepath,
+                    'hostname': hostname,
+                    'device_type': device_type
+                })
+                file_id += 1
+                logger.debug("Added %s as %s", filepath, device_type)
 
-        except Exception as e:
-            logger.warning(f"Could not process {filepath}: {e}")
-            continue
+            except Exception as e:
+                logger.warning(f"Could not process {filepath}: {e}")
+                continue
 
     return cisco_files
 
@@ -1554,6 +2002,8 @@ def display_file_selection(files: List[Dict]) -> None:
         print("No Cisco show tech files found in input directory")
         return
 
+    from tabulate import tabulate  # Only needed for the interactive menu
+
     headers = ["ID", "Hostname", "Device Type", "Filename"]
     table_data = [
         [f['id'], f['hostname'], f['device_type'], f['filename']]
@@ -1592,6 +2042,7 @@ def main():
 
         # Otherwise, show file selection
         cisco_files = find_cisco_files()
+        files_by_id = {f['id']: f for f in cisco_files}
         while True:
             try:
                 display_file_selection(cisco_files)
@@ -1606,7 +2057,7 @@ def main():
                 else:
                     try:
                         file_id = int(choice)
-                        file_info = next((f for f in cisco_files if f['id'] == file_id), None)
+                        file_info = files_by_id.get(file_id)
                         if file_info:
                             process_file(file_info['filename'], args.type, args.display)
                         else:
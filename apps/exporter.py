@@ -16,9 +16,11 @@ Features:
 import os
 import datetime
 import logging
+import warnings
 import openpyxl
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
@@ -83,10 +85,9 @@ def export_data_to_excel(parsed_data: Dict[str, List[Dict]], output_dir: str, ho
         output_filename = f"{hostname}_{timestamp}.xlsx"
         final_output_path = os.path.join(output_dir, output_filename)
 
-        workbook = openpyxl.Workbook()
-        # Remove the default sheet created by openpyxl
-        if 'Sheet' in workbook.sheetnames:
-            del workbook['Sheet']
+        # Write-only workbooks stream rows straight to the sheet XML instead of
+        # keeping a Cell object per value, and start without a default sheet
+        workbook = openpyxl.Workbook(write_only=True)
 
         if not parsed_data:
             logger.warning("No data provided to export.")
@@ -136,10 +137,19 @@ def export_data_to_excel(parsed_data: Dict[str, List[Dict]], output_dir: str, ho
             if headers: # Ensure headers exist before creating table
                  table_ref = f"A1:{get_column_letter(len(headers))}{len(sheet_data) + 1}"
                  table = Table(displayName=f"{safe_sheet_name.replace(' ', '_')}Table", ref=table_ref)
+                 # Write-only sheets cannot be read back, so name the table columns
+                 # from the headers instead of letting openpyxl read the header row
+                 table.tableColumns = [TableColumn(id=idx, name=str(header))
+                                       for idx, header in enumerate(headers, 1)]
+                 table.autoFilter = AutoFilter(ref=table_ref)
                  style = TableStyleInfo(name="TableStyleMedium9", showFirstColumn=False,
                                         showLastColumn=False, showRowStripes=True, showColumnStripes=True)
                  table.tableStyleInfo = style
-                 sheet.add_table(table)
+                 with warnings.catch_warnings():
+                     # openpyxl warns on every write-only add_table, even with columns set
+                     warnings.filterwarnings("ignore", message="In write-only mode you must add table columns manually",
+                                             category=UserWarning, module="openpyxl")
+                     sheet.add_table(table)
             else:
                  logger.warning(f"Cannot create table for sheet '{safe_sheet_name}' due to missing headers.")
 
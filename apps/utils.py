@@ -12,6 +12,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Dotted-decimal subnet mask (e.g. '255.255.255.0') to prefix length, for every valid prefix
+_NETMASK_TO_PREFIX = {
+    str(ipaddress.IPv4Network(f'0.0.0.0/{prefixlen}').netmask): prefixlen
+    for prefixlen in range(33)
+}
+
 def ip_mask_to_cidr(ip: str, mask: str) -> str:
     """
     Convert an IP address and subnet mask to CIDR notation.
@@ -44,10 +50,16 @@ def ip_mask_to_cidr(ip: str, mask: str) -> str:
           * 255.255.0.0    -> /16
           * 255.0.0.0      -> /8
         - Invalid inputs are logged as warnings and return empty string
+        - Dotted-decimal masks are resolved from a precomputed table, so only
+          the address is validated; other mask forms go through ipaddress
     """
     if not ip or not mask:
         return ""
+    prefixlen = _NETMASK_TO_PREFIX.get(mask)
     try:
+        if prefixlen is not None:
+            ipaddress.IPv4Address(ip)  # Validate only; strict parsing means str() == ip
+            return f"{ip}/{prefixlen}"
         interface = ipaddress.IPv4Interface(f"{ip}/{mask}")
         return str(interface)
     except (ipaddress.AddressValueError, ipaddress.NetmaskValueError, ValueError) as e:
@@ -0,0 +1,68 @@
+"""
+Worker Process Module
+
+This module provides the process pool used to parse and export several
+configuration files at once. Parsing is CPU-bound Python, so files are handled
+in worker processes rather than threads.
+
+Features:
+- Forwards worker log records to the parent process through a queue
+- Leaves the log file and its daily rotation to the parent's handlers
+- Applies the parent's logging level in every worker
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, Optional
+
+
+def _init_worker_logging(log_queue: multiprocessing.Queue, level: int) -> None:
+    """
+    Route a worker's log records to the parent process.
+
+    Handlers inherited from the parent (a forked worker gets copies of the
+    TimedRotatingFileHandler and the console handler) are dropped, so only the
+    parent writes to and rotates the log file.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue drained by the parent's listener
+        level (int): Root logging level of the parent
+    """
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+
+@contextmanager
+def process_pool(max_workers: Optional[int] = None) -> Iterator[ProcessPoolExecutor]:
+    """
+    Open a ProcessPoolExecutor whose workers log through the parent's handlers.
+
+    Args:
+        max_workers (Optional[int]): Number of worker processes.
+                                     Defaults to the number of CPUs.
+
+    Yields:
+        ProcessPoolExecutor: The executor; it is shut down, waiting for pending
+                             work, when the block exits
+
+    Example:
+        with process_pool() as executor:
+            results = list(executor.map(parse, paths))
+    """
+    root_logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker_logging,
+                                 initargs=(log_queue, root_logger.level)) as executor:
+            yield executor
+    finally:
+        listener.stop()
@@ -23,11 +23,13 @@ from logging.handlers import TimedRotatingFileHandler
 import os
 import sys
 from datetime import datetime
+from itertools import chain
 from rich.logging import RichHandler
 from rich.console import Console
 from rich.theme import Theme
 from tabulate import tabulate
 from apps.identify import identify_device_type
+from apps.workers import process_pool
 
 def setup_logging(debug_mode: bool = False) -> None:
     """
@@ -208,6 +210,7 @@ def main():
         if not files:
             logger.warning("No configuration files found to process")
             return
+        files_by_id = {f[0]: f for f in files}
 
         # Display file selection menu
         while True:
@@ -225,12 +228,27 @@ def main():
             if choice == 'q':
                 break
             elif choice == 'all':
-                for file_id, filepath, device_type in files:
-                    process_file(filepath, device_type, args.display)
+                if args.display:
+                    for file_id, filepath, device_type in files:
+                        process_file(filepath, device_type, args.display)
+                else:
+                    # Excel exports are independent per file, so parse and export
+                    # them in worker processes. process_file re-raises parse and
+                    # export errors; as in the serial loop, the first failing file
+                    # stops the run and files not yet started are cancelled
+                    with process_pool() as executor:
+                        futures = [executor.submit(process_file, filepath, device_type, args.display)
+                                   for file_id, filepath, device_type in files]
+                        try:
+                            for future in futures:
+                                future.result()
+                        except Exception:
+                            executor.shutdown(cancel_futures=True)
+                            raise
             else:
                 try:
                     file_id = int(choice)
-                    selected = next((f for f in files if f[0] == file_id), None)
+                    selected = files_by_id.get(file_id)
                     if selected:
                         process_file(selected[1], selected[2], args.display)
                     else:
@@ -245,6 +263,52 @@ def main():
         logger.error(f"Error processing configuration: {e}", exc_info=True)
         sys.exit(1)
 
+def format_grid(headers: list, rows: list) -> str:
+    """
+    Render rows in the layout of tabulate's "grid" format with disable_numparse=True.
+
+    Column widths are computed in a single pass over the cells and every cell is
+    left-justified, which skips tabulate's per-cell type detection and alignment.
+    As in tabulate, cells are stripped, None renders empty, multi-line cells span
+    several text lines and each column is at least two wider than its header.
+    Widths count characters, so East Asian wide characters are not padded the way
+    tabulate pads them when wcwidth is installed.
+
+    Args:
+        headers (list): Column headers
+        rows (list): Row value sequences, one value per header
+
+    Returns:
+        str: The rendered table, without a trailing newline
+
+    Example:
+        print(format_grid(['Interface', 'VLAN'], [['Gi0/1', '10']]))
+    """
+    headers = [str(header) for header in headers]
+    rows = [[('' if value is None else str(value)).strip().split('\n') for value in row] for row in rows]
+    widths = [len(header) + 2 for header in headers]
+    for row in rows:
+        for index, cell in enumerate(row):
+            widths[index] = max(widths[index], *map(len, cell))
+    separator = '+' + '+'.join('-' * (width + 2) for width in widths) + '+'
+    header_separator = separator.replace('-', '=')
+
+    def format_row(cells):
+        if all(len(cell) == 1 for cell in cells):
+            return '| ' + ' | '.join(cell[0].ljust(width) for cell, width in zip(cells, widths)) + ' |'
+        height = max(map(len, cells))
+        return '\n'.join(
+            '| ' + ' | '.join((cell[line] if line < len(cell) else '').ljust(width)
+                              for cell, width in zip(cells, widths)) + ' |'
+            for line in range(height)
+        )
+
+    lines = [separator, format_row([[header] for header in headers]), header_separator]
+    for row in rows:
+        lines.append(format_row(row))
+        lines.append(separator)
+    return '\n'.join(lines)
+
 def process_file(filepath: str, device_type: str, display: bool) -> None:
     """
     Process a single network device configuration file.
@@ -303,13 +367,14 @@ def process_file(filepath: str, device_type: str, display: bool) -> None:
                 from apps.exporter import export_data_to_excel
                 export_data_to_excel(combined_data, output_dir, hostname)
             else:
-                # Display tables in console using tabulate
+                # Display tables in console in tabulate's grid layout
                 for sheet_name, data in combined_data.items():
                     if data:
                         logger.info(f"Adding new sheet: {sheet_name}")
-                        headers = data[0].keys()
-                        table_data = [row.values() for row in data]
-                        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+                        # Error rows carry fewer keys, so take every key in first-seen order
+                        headers = list(dict.fromkeys(chain.from_iterable(data)))
+                        table_data = [[row.get(header, '') for header in headers] for row in data]
+                        print(format_grid(headers, table_data))
 
     except Exception as e:
         logger.error(f"Failed to process {filepath}: {e}", exc_info=True)
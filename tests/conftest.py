@@ -0,0 +1,27 @@
+"""Shared fixtures for the parser tests."""
+
+import os
+
+import pytest
+
+from apps import cisco_if_parser
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def data_path(name: str) -> str:
+    """Return the path of a sample capture under tests/data."""
+    return os.path.join(DATA_DIR, name)
+
+
+@pytest.fixture(autouse=True)
+def isolated_section_caches(monkeypatch, tmp_path):
+    """Start every test with empty section caches and the disk cache off."""
+    monkeypatch.delenv(cisco_if_parser._DISK_CACHE_ENV, raising=False)
+    monkeypatch.setattr(cisco_if_parser, "_DISK_CACHE_DIR", str(tmp_path / "section-cache"))
+    parser_class = cisco_if_parser.CiscoConfigParser
+    parser_class._section_cache.clear()
+    parser_class._config_lines_cache.clear()
+    yield
+    parser_class._section_cache.clear()
+    parser_class._config_lines_cache.clear()
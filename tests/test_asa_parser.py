@@ -0,0 +1,143 @@
+"""Tests for the Cisco ASA parser."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ntc_templates")
+
+from apps.asa_parser import AsaParser, AsaRunningConfigParser  # noqa: E402
+
+
+def _parser_with(parsed_data):
+    parser = AsaParser("unused.txt")
+    parser.parsed_data = parsed_data
+    return parser
+
+
+def test_to_dataframes_uses_union_of_row_keys():
+    rows = [
+        {"Error": "could not parse line"},
+        {"Name": "WEB", "Type": "network"},
+        {"Name": "SVC", "Type": "service", "Protocol": "tcp"},
+    ]
+    frame = _parser_with({"objects": rows}).to_dataframes()["objects"]
+
+    assert list(frame.columns) == ["Error", "Name", "Type", "Protocol"]
+    assert frame.to_dict("records") == [
+        {"Error": "could not parse line", "Name": "", "Type": "", "Protocol": ""},
+        {"Error": "", "Name": "WEB", "Type": "network", "Protocol": ""},
+        {"Error": "", "Name": "SVC", "Type": "service", "Protocol": "tcp"},
+    ]
+
+
+def test_to_dataframes_skips_empty_sections():
+    frames = _parser_with({"objects": [], "routes": [{"Interface": "outside"}]}).to_dataframes()
+    assert list(frames) == ["routes"]
+
+
+def _baseline_object_details(text):
+    """extract_object_details as it was before the keyword dispatch table."""
+    parts = text.split()
+    if 'network-object' in parts:
+        return 'network-object', parts[-1]
+    elif 'subnet' in parts:
+        return 'subnet', parts[-2]
+    elif 'host' in parts:
+        return 'host', parts[-1]
+    elif 'fqdn' in parts:
+        version = 'v4' if 'ipv4' in parts else 'v6'
+        return f'FQDN {version}', parts[-1]
+    elif 'range' in parts:
+        return 'range', parts[-2]
+    elif 'port-object' in parts:
+        return 'port-object', parts[-1]
+    elif 'service-object' in parts:
+        return 'service-object', ' '.join(parts[1:])
+    elif 'group-object' in parts:
+        return 'group-object', parts[1]
+    return '', ''
+
+
+@pytest.mark.parametrize("text", [
+    "network-object host 10.1.1.10",
+    "network-object object WEB-SERVER",
+    "network-object 10.1.0.0 255.255.0.0",
+    "subnet 10.2.0.0 255.255.255.0",
+    "host 10.3.3.3",
+    "fqdn v4 www.example.com",
+    "fqdn v6 www.example.com",
+    "port-object eq https",
+    "port-object neq 8080",
+    "service-object tcp destination eq www",
+    "service-object icmp echo",
+    "group-object INTERNAL-NETS",
+    "description web servers",
+    "",
+])
+def test_extract_object_details_matches_baseline(text):
+    child = SimpleNamespace(text=text)
+    assert AsaRunningConfigParser("").extract_object_details(child) == _baseline_object_details(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("range 10.4.4.1 10.4.4.20", ("range", "10.4.4.1-10.4.4.20")),
+    ("port-object range 1000 2000", ("port-object", "1000-2000")),
+])
+def test_extract_object_details_reports_both_range_ends(text, expected):
+    child = SimpleNamespace(text=text)
+    assert AsaRunningConfigParser("").extract_object_details(child) == expected
+
+
+_ACL_OBJECTS = {
+    "WEB": {"Object Type": "network"},
+    "NETS": {"Object Type": "network-object"},
+    "PROTO": {"Object Type": "protocol"},
+    "HTTPS": {"Object Type": "service"},
+    "TCP-PORTS": {"Object Type": "tcp"},
+}
+
+_ACL_FIELDS = ("Protocol", "Source", "Source Port", "Destination", "Destination Port",
+               "Log Status", "Inactive")
+
+
+# Expected values were produced by the token loop parse_access_list used before
+# the per-token handler dispatch.
+@pytest.mark.parametrize("text, expected", [
+    ("access-list OUTSIDE_IN extended permit tcp any object WEB eq https",
+     ("tcp", "any", "", "WEB", "https", "", "")),
+    ("access-list OUTSIDE_IN extended permit tcp object-group NETS object WEB eq 443",
+     ("tcp", "NETS", "", "WEB", "443", "", "")),
+    ("access-list OUTSIDE_IN extended permit object-group PROTO any object WEB",
+     ("", "PROTO", "", "WEB", "", "", "")),
+    ("access-list OUTSIDE_IN extended permit tcp any object WEB object-group HTTPS",
+     ("tcp", "any", "", "WEB", "HTTPS", "", "")),
+    ("access-list OUTSIDE_IN extended permit tcp any eq 1024 object WEB object-group TCP-PORTS",
+     ("tcp", "any", "1024", "WEB", "TCP-PORTS", "", "")),
+    ("access-list OUTSIDE_IN extended deny ip any any log disable",
+     ("ip", "any", "", "any", "", "disable", "")),
+    ("access-list OUTSIDE_IN extended permit udp object UNKNOWN any eq domain inactive",
+     ("udp", "UNKNOWN", "", "any", "domain", "", "Inactive")),
+    ("access-list OUTSIDE_IN extended permit icmp any any echo-reply",
+     ("icmp", "any", "", "any", "", "", "")),
+    ("access-list OUTSIDE_IN extended permit tcp any object",
+     ("tcp", "any", "", "", "", "", "")),
+    ("access-list OUTSIDE_IN extended permit tcp any eq",
+     ("tcp", "any", "", "", "", "", "")),
+])
+def test_parse_access_list_matches_baseline(text, expected):
+    parser = AsaRunningConfigParser("")
+    parser.objects_data = _ACL_OBJECTS
+    entry = parser.parse_access_list(SimpleNamespace(text=text), 7)
+
+    assert tuple(entry[field] for field in _ACL_FIELDS) == expected
+    assert (entry["ACL Name"], entry["Line Number"], entry["Type"], entry["Remark"]) == ("OUTSIDE_IN", 7, "extended", "")
+
+
+def test_parse_access_list_remark():
+    parser = AsaRunningConfigParser("")
+    entry = parser.parse_access_list(SimpleNamespace(text="access-list OUTSIDE_IN remark Allow web traffic"), 3)
+
+    assert entry["Type"] == "remark"
+    assert entry["Remark"] == "Allow web traffic"
+    assert all(entry[field] == "" for field in _ACL_FIELDS)
@@ -0,0 +1,251 @@
+"""Tests for the helpers of the Cisco IOS/NXOS parser."""
+
+import io
+import re
+import shutil
+
+import pytest
+
+from apps.cisco_if_parser import (CiscoACLParser, CiscoConfigParser, CiscoInterfaceParser, _IOS_HEADER_RE,
+                                  _NEXUS_HEADER_RE, _PARALLEL_LISTING_MIN_FILES, _acl_sort_key,
+                                  _iter_interface_blocks, _split_sections, find_cisco_files)
+
+from conftest import data_path
+
+
+def _ciscoconfparse_blocks(lines):
+    """Interface blocks as CiscoConfParse sees them, minus '!' comment children.
+
+    CiscoConfParse keeps some indented '!' lines as children depending on what
+    precedes them; _iter_interface_blocks skips all of them, and no child
+    handler in _parse_interfaces matches a comment.
+    """
+    ciscoconfparse2 = pytest.importorskip("ciscoconfparse2")
+    parse = ciscoconfparse2.CiscoConfParse(lines)
+    return [(obj.text, [child.text for child in obj.children if not child.text.lstrip().startswith("!")])
+            for obj in parse.find_objects(r"^interface")]
+
+
+@pytest.mark.parametrize("name", ["ios_show_tech.txt", "nxos_show_tech.txt"])
+def test_iter_interface_blocks_matches_ciscoconfparse_on_samples(name):
+    lines = CiscoInterfaceParser(data_path(name))._config_lines
+    blocks = list(_iter_interface_blocks(lines))
+
+    assert blocks
+    assert blocks == _ciscoconfparse_blocks(lines)
+
+
+@pytest.mark.parametrize("lines", [
+    # '!' separators inside and between blocks
+    ["interface Gi0/1", " description uplink", "!", " shutdown", "!", "interface Gi0/2", " no shutdown"],
+    # Indented '!' comments, including one before a deeper first child
+    ["interface Gi0/1", " ! managed by automation", " description uplink", "  ! nested", " !"],
+    ["interface Gi0/1", "  ! comment", " description uplink", " ! trailing"],
+    # Blank and whitespace-only lines
+    ["interface Gi0/1", "", " description uplink", "   ", " shutdown", "hostname R1", "interface Gi0/2"],
+    # Lines nested under a child are dropped
+    ["interface Gi0/1", " service-policy input QOS", "  class VOICE", "   police 8000", " description d"],
+    # First child indented deeper than later ones
+    ["interface Gi0/1", "   description deep", " shutdown"],
+    # Tab indentation
+    ["interface Gi0/1", "\tdescription uplink", "\t\tnested", "\tshutdown", "interface Gi0/2", "\tno shutdown"],
+    # Other parents end the block; their children are not collected
+    ["router ospf 1", " network 10.0.0.0 0.255.255.255 area 0", "interface Gi0/1",
+     " ip address 10.1.1.1 255.255.255.0", "line vty 0 4", " login"],
+])
+def test_iter_interface_blocks_matches_ciscoconfparse(lines):
+    assert list(_iter_interface_blocks(lines)) == _ciscoconfparse_blocks(lines)
+
+
+def test_acl_sort_key_orders_numbered_acls_by_value_before_named():
+    acl_ids = ["OUTSIDE_IN", "100", "99", "1", "2000", "10", "ACL-B", "1a"]
+    assert sorted(acl_ids, key=_acl_sort_key) == ["1", "10", "99", "100", "2000", "1a", "ACL-B", "OUTSIDE_IN"]
+
+
+def test_acl_parser_lists_acls_in_sort_key_order():
+    parser = CiscoACLParser(data_path("ios_show_tech.txt"))
+    assert list(parser.acls) == ["1", "10", "100", "101"]
+    exported = [row["Number"] for row in parser.parsed_data["Access Lists"]]
+    assert list(dict.fromkeys(exported)) == ["1", "10", "100", "101"]
+
+
+# Header patterns and line-by-line scan used before sections were sliced out of
+# the mapped file
+_BASELINE_HEADER_PATTERNS = {
+    "ios": (_IOS_HEADER_RE, re.compile(r"^(?:-{5,}|\*{5,}|={5,})\s*(show\s+.*?)\s*(?:-{5,}|\*{5,}|={5,})\s*$")),
+    "nexus": (_NEXUS_HEADER_RE, re.compile(r"^(?:`|')\s*(show\s+.*?)\s*(?:`|')\s*$")),
+}
+
+
+def _baseline_sections(data, header_pattern):
+    sections = {}
+    current_command = None
+    current_content = []
+    for line in io.TextIOWrapper(io.BytesIO(data), encoding="ascii", errors="ignore"):
+        line = line.rstrip("\n")
+        match = header_pattern.match(line)
+        if match:
+            if current_command:
+                section_content = "\n".join(current_content)
+                if section_content:
+                    sections[current_command] = section_content
+            current_command = match.group(1)
+            current_content = []
+            continue
+        if current_command:
+            current_content.append(line)
+    if current_command and current_content:
+        sections[current_command] = "\n".join(current_content)
+    return sections
+
+
+def _split(data, style):
+    pattern, baseline_pattern = _BASELINE_HEADER_PATTERNS[style]
+    return dict(_split_sections(data, pattern)), _baseline_sections(data, baseline_pattern)
+
+
+@pytest.mark.parametrize("name, style", [
+    ("ios_show_tech.txt", "ios"),
+    ("nxos_show_tech.txt", "nexus"),
+])
+def test_split_sections_matches_line_scan_on_samples(name, style):
+    with open(data_path(name), "rb") as f:
+        sections, expected = _split(f.read(), style)
+
+    assert sections
+    assert sections == expected
+
+
+@pytest.mark.parametrize("data", [
+    # Preamble before the first header, blank lines kept inside sections
+    b"preamble\n------ show version ------\nv1\n\nv2\n------ show clock ------\n10:00\n",
+    # Empty section, header at the end of the file, no trailing newline
+    b"----- show a -----\n----- show b -----\nb\n***** show c *****",
+    b"===== show a =====\na1\na2",
+    # Trailing blank lines, CRLF and bare CR line endings inside content
+    b"----- show a -----\r\na1\r\na2\r\n\r\n----- show b -----\r\nb\r\n",
+    b"----- show a -----\na1\ra2\n",
+    # Repeated command: later non-empty sections win, empty ones do not
+    b"----- show a -----\nfirst\n----- show a -----\nsecond\n----- show a -----\n",
+    # Header-like lines that do not match
+    b"----- show a -----\n---- show x ----\n----- not show -----\n  ----- show y -----\n",
+    # Non-ASCII bytes are dropped
+    b"----- show a -----\ncaf\xc3\xa9\n\xff\n",
+], ids=["preamble", "empty-and-eof", "no-newline", "crlf", "bare-cr", "repeated", "near-miss", "non-ascii"])
+def test_split_sections_matches_line_scan_ios(data):
+    sections, expected = _split(data, "ios")
+    assert sections == expected
+
+
+@pytest.mark.parametrize("data", [
+    b"`show version`\nNX-OS\n`show interface brief`\nEth1/1 up\n\n",
+    b"'show a'\na\n` show b `\r\nb\r\n`show c`",
+    b"`show a`\n`show b`\n`not show`\nx\n",
+], ids=["basic", "quotes-and-crlf", "empty-and-near-miss"])
+def test_split_sections_matches_line_scan_nexus(data):
+    sections, expected = _split(data, "nexus")
+    assert sections == expected
+
+
+# Counter patterns that _IF_COUNTERS_RE replaced, each searched on its own
+_BASELINE_RATE_RE = re.compile(r'(\d+) minute input rate (\d+) bits/sec.*?(\d+) minute output rate (\d+) bits/sec', re.DOTALL | re.ASCII)
+_BASELINE_PACKETS_RE = re.compile(r'(\d+) packets input,\s*(\d+) bytes.*?(\d+) packets output,\s*(\d+) bytes', re.DOTALL | re.ASCII)
+_BASELINE_INPUT_ERRORS_RE = re.compile(r'(\d+) input errors,\s*(\d+) CRC,\s*(\d+) frame,\s*(\d+) overrun', re.ASCII)
+_BASELINE_OUTPUT_ERRORS_RE = re.compile(r'(\d+) output errors', re.ASCII)
+_BASELINE_RESETS_RE = re.compile(r'(\d+) interface resets', re.ASCII)
+_BASELINE_CARRIER_RE = re.compile(r'(\d+) lost carrier, (\d+) no carrier', re.ASCII)
+
+_COUNTER_FIELDS = ("input_rate (bps)", "output_rate (bps)", "input_packets", "input_bytes", "output_packets",
+                   "output_bytes", "input_errors", "crc_errors", "frame_errors", "overrun_errors",
+                   "output_errors", "interface_resets", "carrier_transitions")
+
+
+def _baseline_counter_fields(section):
+    fields = dict.fromkeys(_COUNTER_FIELDS, "")
+    rate_match = _BASELINE_RATE_RE.search(section)
+    if rate_match:
+        fields["input_rate (bps)"], fields["output_rate (bps)"] = rate_match.group(2, 4)
+    packets_match = _BASELINE_PACKETS_RE.search(section)
+    if packets_match:
+        (fields["input_packets"], fields["input_bytes"],
+         fields["output_packets"], fields["output_bytes"]) = packets_match.groups()
+    input_errors_match = _BASELINE_INPUT_ERRORS_RE.search(section)
+    if input_errors_match:
+        (fields["input_errors"], fields["crc_errors"],
+         fields["frame_errors"], fields["overrun_errors"]) = input_errors_match.groups()
+    output_errors_match = _BASELINE_OUTPUT_ERRORS_RE.search(section)
+    if output_errors_match:
+        fields["output_errors"] = output_errors_match.group(1)
+    resets_match = _BASELINE_RESETS_RE.search(section)
+    if resets_match:
+        fields["interface_resets"] = resets_match.group(1)
+    carrier_match = _BASELINE_CARRIER_RE.search(section)
+    if carrier_match:
+        fields["carrier_transitions"] = str(int(carrier_match.group(1)) + int(carrier_match.group(2)))
+    return fields
+
+
+_STANDARD_COUNTERS = """\
+  5 minute input rate 1000 bits/sec, 1 packets/sec
+  5 minute output rate 2000 bits/sec, 2 packets/sec
+     100 packets input, 20000 bytes, 0 no buffer
+     Received 10 broadcasts (5 multicasts)
+     3 input errors, 1 CRC, 2 frame, 0 overrun, 0 ignored
+     200 packets output, 40000 bytes, 0 underruns
+     4 output errors, 0 collisions, 1 interface resets
+     2 lost carrier, 3 no carrier, 0 pause output
+"""
+
+
+@pytest.mark.parametrize("counters", [
+    _STANDARD_COUNTERS,
+    # Output counters before their input counterpart are ignored until an input is seen
+    "  5 minute output rate 9 bits/sec, 0 packets/sec\n  5 minute input rate 1 bits/sec, 0 packets/sec\n"
+    "  5 minute output rate 2 bits/sec, 0 packets/sec\n"
+    "     7 packets output, 70 bytes\n     1 packets input, 10 bytes\n     2 packets output, 20 bytes\n",
+    # Output counter without an input counter, and vice versa
+    "  5 minute output rate 2 bits/sec, 0 packets/sec\n     1 packets input, 10 bytes\n",
+    # Repeated counters (two load intervals): the first of each wins
+    "  30 second input rate 5 bits/sec\n  1 minute input rate 11 bits/sec, 0 packets/sec\n"
+    "  1 minute output rate 12 bits/sec, 0 packets/sec\n  5 minute input rate 51 bits/sec, 0 packets/sec\n"
+    "  5 minute output rate 52 bits/sec, 0 packets/sec\n"
+    "     0 output errors, 5 interface resets\n     9 output errors, 6 interface resets\n",
+    # Values split across lines where the old patterns allowed whitespace
+    "     100 packets input,\n        20000 bytes\n     200 packets output,   40000 bytes\n"
+    "     3 input errors,\n 1 CRC,  2 frame,\t0 overrun\n",
+    # No counters at all
+    "  Encapsulation ARPA, loopback not set\n",
+], ids=["standard", "output-before-input", "unpaired", "repeated", "wrapped", "none"])
+def test_interface_counters_match_separate_patterns(tmp_path, counters):
+    with open(data_path("ios_show_tech.txt")) as f:
+        show_tech = f.read()
+    head, rest = show_tech.split("------------------ show interfaces ------------------\n")
+    tail = rest[rest.index("------------------ show interfaces trunk"):]
+    section = "GigabitEthernet1/0/1 is up, line protocol is up (connected)\n" + counters
+    path = tmp_path / "show_tech.txt"
+    path.write_text(head + "------------------ show interfaces ------------------\n" + section + tail)
+
+    interface = CiscoInterfaceParser(str(path)).interfaces["GigabitEthernet1/0/1"]
+    expected = _baseline_counter_fields(section)
+
+    assert {field: interface[field] for field in _COUNTER_FIELDS} == expected
+
+
+def test_parallel_listing_keeps_sections_in_the_parent_cache(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "input").mkdir()
+    for index in range(_PARALLEL_LISTING_MIN_FILES):
+        shutil.copy(data_path("ios_show_tech.txt"), tmp_path / "input" / f"switch{index}.txt")
+
+    files = find_cisco_files()
+    assert len(files) == _PARALLEL_LISTING_MIN_FILES
+    assert len(CiscoConfigParser._section_cache) == _PARALLEL_LISTING_MIN_FILES
+
+    def fail_extraction(self):
+        raise AssertionError("sections were re-extracted instead of taken from the listing")
+
+    monkeypatch.setattr(CiscoConfigParser, "_extract_sections", fail_extraction)
+    for info in files:
+        parser = CiscoInterfaceParser(info["filename"])
+        assert (parser.hostname, parser.device_type) == (info["hostname"], info["device_type"])
+        assert "show running-config" in parser.sections or "show running" in parser.sections
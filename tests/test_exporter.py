@@ -0,0 +1,37 @@
+"""Tests for the Excel exporter."""
+
+import os
+import warnings
+
+import openpyxl
+
+from apps.exporter import export_data_to_excel
+
+
+def test_export_writes_rows_and_table_without_warnings(tmp_path):
+    data = {"Interfaces": [{"Interface": "Gi0/1", "VLAN": "10"}, {"Interface": "Gi0/2"}]}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        export_data_to_excel(data, str(tmp_path), "sw1")
+
+    (filename,) = os.listdir(tmp_path)
+    sheet = openpyxl.load_workbook(tmp_path / filename)["Interfaces"]
+    assert list(sheet.values) == [("Interface", "VLAN"), ("Gi0/1", "10"), ("Gi0/2", None)]
+    assert list(sheet.tables) == ["InterfacesTable"]
+
+
+def test_export_keeps_other_warnings_from_add_table(tmp_path, monkeypatch):
+    # Same text but not raised by openpyxl, and a different message
+    def add_table(self, table):
+        warnings.warn("In write-only mode you must add table columns manually", UserWarning)
+        warnings.warn("some other warning", UserWarning)
+
+    monkeypatch.setattr(openpyxl.worksheet._write_only.WriteOnlyWorksheet, "add_table", add_table)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        export_data_to_excel({"Interfaces": [{"Interface": "Gi0/1"}]}, str(tmp_path), "sw1")
+
+    assert [str(w.message) for w in caught] == [
+        "In write-only mode you must add table columns manually",
+        "some other warning",
+    ]
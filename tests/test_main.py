@@ -0,0 +1,55 @@
+"""Tests for the console display helpers in main.py."""
+
+import pytest
+from tabulate import tabulate
+
+import main
+from main import format_grid
+
+
+@pytest.mark.parametrize("headers, rows", [
+    (["Interface", "VLAN", "Description"], [["Gi0/1", "10", "uplink"], ["Gi0/2", "20", "server"]]),
+    (["ID", "N"], [[1, 2.5], [10, None]]),
+    (["A", " B "], [[" x ", "y  "], ["", None]]),
+    (["Name", "Value"], [[" first \n  second ", "x"], ["a", "b\nc\nd"]]),
+    (["", "Port"], [["Gi0/1", "443"]]),
+    (["Long header name", "X"], [["a", "a much longer cell value than the header"]]),
+])
+def test_format_grid_matches_tabulate(headers, rows):
+    expected = tabulate(rows, headers=headers, tablefmt="grid", disable_numparse=True)
+    assert format_grid(headers, rows) == expected
+
+
+def test_format_grid_matches_tabulate_on_row_views():
+    data = [{"Interface": f"Gi0/{i}", "Status": "up" if i % 2 else "down"} for i in range(50)]
+    headers = list(data[0].keys())
+    rows = [row.values() for row in data]
+
+    expected = tabulate([row.values() for row in data], headers=headers, tablefmt="grid", disable_numparse=True)
+    assert format_grid(headers, rows) == expected
+
+
+def test_process_file_displays_ragged_rows(monkeypatch, capsys):
+    rows = [
+        {"Full Parsed Line": "object network broken"},
+        {"Name": "web", "Type": "host", "Value": "10.0.0.1"},
+        {"Name": "db", "Type": "subnet"},
+    ]
+
+    class RaggedParser:
+        def __init__(self, filepath):
+            pass
+
+        def parse_file(self):
+            return {"Objects": rows}
+
+        def get_hostname(self):
+            return "asa1"
+
+    monkeypatch.setattr(main, "get_parser_class", lambda device_type: (RaggedParser,))
+    main.process_file("asa1.txt", "Cisco ASA", display=True)
+
+    headers = ["Full Parsed Line", "Name", "Type", "Value"]
+    expected = tabulate([["object network broken", "", "", ""], ["", "web", "host", "10.0.0.1"], ["", "db", "subnet", ""]],
+                        headers=headers, tablefmt="grid", disable_numparse=True)
+    assert capsys.readouterr().out == expected + "\n"
@@ -0,0 +1,78 @@
+"""Tests for the opt-in on-disk section cache of the Cisco IOS/NXOS parser."""
+
+import json
+import os
+
+from apps import cisco_if_parser
+from apps.cisco_if_parser import CiscoConfigParser, CiscoInterfaceParser
+
+from conftest import data_path
+
+
+def _cache_files():
+    cache_dir = cisco_if_parser._DISK_CACHE_DIR
+    return sorted(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else []
+
+
+def _forget_in_memory():
+    CiscoConfigParser._section_cache.clear()
+    CiscoConfigParser._config_lines_cache.clear()
+
+
+def test_disk_cache_is_off_by_default():
+    CiscoInterfaceParser(data_path("ios_show_tech.txt"))
+    assert _cache_files() == []
+
+
+def test_disk_cache_round_trips_as_json(monkeypatch):
+    monkeypatch.setenv(cisco_if_parser._DISK_CACHE_ENV, "1")
+    first = CiscoInterfaceParser(data_path("ios_show_tech.txt"))
+
+    (name,) = _cache_files()
+    with open(os.path.join(cisco_if_parser._DISK_CACHE_DIR, name), encoding="utf-8") as f:
+        entry = json.load(f)
+    assert entry["version"] == cisco_if_parser._DISK_CACHE_VERSION
+    assert entry["sections"] == first.sections
+
+    def fail_extraction(self):
+        raise AssertionError("sections were re-extracted instead of loaded from disk")
+
+    _forget_in_memory()
+    monkeypatch.setattr(CiscoConfigParser, "_extract_sections", fail_extraction)
+    second = CiscoInterfaceParser(data_path("ios_show_tech.txt"))
+    assert second.sections == first.sections
+    assert (second.hostname, second.device_type) == (first.hostname, first.device_type)
+
+
+def test_disk_cache_ignores_other_versions_and_malformed_entries(monkeypatch):
+    monkeypatch.setenv(cisco_if_parser._DISK_CACHE_ENV, "1")
+    CiscoInterfaceParser(data_path("ios_show_tech.txt"))
+    (name,) = _cache_files()
+    cache_path = os.path.join(cisco_if_parser._DISK_CACHE_DIR, name)
+    key = cisco_if_parser._disk_cache_key(cisco_if_parser._file_signature(data_path("ios_show_tech.txt")))
+
+    with open(cache_path, encoding="utf-8") as f:
+        entry = json.load(f)
+    entry["version"] = cisco_if_parser._DISK_CACHE_VERSION - 1
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    assert cisco_if_parser._load_disk_cache(key) is None
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write("not json")
+    assert cisco_if_parser._load_disk_cache(key) is None
+
+
+def test_failed_extraction_is_not_cached(monkeypatch):
+    monkeypatch.setenv(cisco_if_parser._DISK_CACHE_ENV, "1")
+
+    def failing_split(data, header_pattern):
+        yield "show version", "partial"
+        raise ValueError("boom")
+
+    monkeypatch.setattr(cisco_if_parser, "_split_sections", failing_split)
+    parser = CiscoInterfaceParser(data_path("ios_show_tech.txt"))
+
+    assert parser.sections == {"show version": "partial"}
+    assert _cache_files() == []
+    assert CiscoConfigParser._section_cache == {}
@@ -0,0 +1,42 @@
+"""Tests for the network utility functions."""
+
+import ipaddress
+import itertools
+
+import pytest
+
+from apps.utils import ip_mask_to_cidr
+
+
+def _baseline_ip_mask_to_cidr(ip, mask):
+    """ip_mask_to_cidr as it was before the netmask prefix table."""
+    if not ip or not mask:
+        return ""
+    try:
+        return str(ipaddress.IPv4Interface(f"{ip}/{mask}"))
+    except (ipaddress.AddressValueError, ipaddress.NetmaskValueError, ValueError):
+        return ""
+
+
+_ADDRESSES = ["10.1.1.1", "192.168.0.255", "0.0.0.0", "255.255.255.255", "172.16.5.4",
+              "010.1.1.1", "10.1.1", "256.1.1.1", " 10.1.1.1", "invalid", ""]
+_MASKS = [str(ipaddress.IPv4Network(f"0.0.0.0/{prefixlen}").netmask) for prefixlen in range(33)] + [
+    "0.0.0.255", "0.255.255.255", "255.0.255.0", "255.255.255.1", "24", "/24", "33",
+    "255.255.255.0 ", "255.255.255.256", "",
+]
+
+
+def test_ip_mask_to_cidr_matches_ipv4interface():
+    mismatches = [(ip, mask) for ip, mask in itertools.product(_ADDRESSES, _MASKS)
+                  if ip_mask_to_cidr(ip, mask) != _baseline_ip_mask_to_cidr(ip, mask)]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize("ip, mask, expected", [
+    ("192.168.1.1", "255.255.255.0", "192.168.1.1/24"),
+    ("10.0.0.1", "255.255.0.0", "10.0.0.1/16"),
+    ("10.0.0.1", "0.0.0.255", "10.0.0.1/24"),
+    ("invalid", "255.255.255.0", ""),
+])
+def test_ip_mask_to_cidr_examples(ip, mask, expected):
+    assert ip_mask_to_cidr(ip, mask) == expected
@@ -0,0 +1,34 @@
+"""Tests for the worker process pool."""
+
+import logging
+
+from apps.workers import process_pool
+
+
+def _log_from_worker(message):
+    logging.getLogger("apps.test_worker").warning("worker says %s", message)
+    return len(logging.getLogger().handlers)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_worker_records_reach_parent_handlers():
+    root_logger = logging.getLogger()
+    handler = _ListHandler()
+    root_logger.addHandler(handler)
+    try:
+        with process_pool(max_workers=2) as executor:
+            handler_counts = list(executor.map(_log_from_worker, ["a", "b"]))
+    finally:
+        root_logger.removeHandler(handler)
+
+    # Workers log through their single queue handler, not inherited copies
+    assert handler_counts == [1, 1]
+    assert sorted(handler.messages) == ["worker says a", "worker says b"]